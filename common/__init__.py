@@ -0,0 +1,4 @@
+"""
+Helpers shared by the LangGraph example scripts.
+
+"""
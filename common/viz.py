@@ -0,0 +1,96 @@
+"""
+Shared graph visualization helper for the LangGraph example scripts.
+
+This module saves a compiled graph's Mermaid diagram as a PNG. Rendering
+goes through the Mermaid web renderer, so results are reused at two levels:
+an in-process LRU cache keyed on the graph's Mermaid source returns the PNG
+bytes for an identical graph without rendering again, and a SHA-256 of the
+same source stored next to the image lets later runs keep an up-to-date
+file untouched.
+
+"""
+
+import functools
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from langchain_core.runnables.graph_mermaid import draw_mermaid_png
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def _render(mermaid_source: str) -> bytes:
+    """
+    Renders Mermaid source to PNG bytes, once per distinct graph.
+
+    Args:
+        mermaid_source (str): The graph's Mermaid diagram source
+
+    Returns:
+        bytes: The rendered PNG image
+    """
+    return draw_mermaid_png(mermaid_source)
+
+
+def save_graph_image(app, out_dir: Path, filename: str = "graph_visualization.png") -> Optional[str]:
+    """
+    Saves the graph visualization to a PNG file.
+
+    Args:
+        app: The compiled graph to visualize
+        out_dir (Path): Absolute directory to save the image in; callers
+            pass their module's own directory, which always exists
+        filename (str): Name of the file to save the image to
+
+    Returns:
+        Optional[str]: Full path to the saved image file, or None if
+        rendering was skipped
+
+    Raises:
+        Exception: If image generation or saving fails
+
+    Caching:
+        The SHA-256 of the graph's Mermaid source is stored next to the image
+        in <filename>.sha256. When the image exists and the key matches the
+        current graph, it is returned without calling the PNG renderer. Set
+        LG_SKIP_GRAPH_IMAGE=1 to skip the visualization entirely.
+    """
+    if os.environ.get("LG_SKIP_GRAPH_IMAGE") == "1":
+        logger.info("LG_SKIP_GRAPH_IMAGE is set, skipping graph visualization")
+        return None
+
+    logger.info("Generating and saving graph visualization")
+
+    try:
+        filepath = out_dir / filename
+        keypath = out_dir / (filename + ".sha256")
+
+        # Key the cached image on the graph structure (the Mermaid source is
+        # produced locally, unlike the PNG render)
+        mermaid_source = app.get_graph().draw_mermaid()
+        key = hashlib.sha256(mermaid_source.encode()).hexdigest()
+        try:
+            cached_key = keypath.read_text(encoding="utf-8").strip()
+        except OSError:
+            cached_key = None
+        if cached_key == key and filepath.exists():
+            logger.info("Graph visualization is up to date: %s", filepath)
+            return str(filepath)
+
+        mermaid_png = _render(mermaid_source)
+        logger.debug("Mermaid diagram generated successfully")
+
+        # Save the image, then record its key
+        filepath.write_bytes(mermaid_png)
+        keypath.write_text(key, encoding="utf-8")
+
+        logger.info("Graph visualization saved to: %s", filepath)
+        return str(filepath)
+
+    except Exception as e:
+        logger.error("Failed to save graph visualization: %s", e)
+        raise
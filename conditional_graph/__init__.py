@@ -0,0 +1,6 @@
+"""
+LangGraph conditional routing graph example.
+
+Run from the repository root with: python -m conditional_graph.main
+
+"""
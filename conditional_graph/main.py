@@ -7,33 +7,82 @@ of numbers through conditional logic, allowing different operations for each pai
 
 """
 
+import asyncio
+import atexit
+import functools
 import logging
-import os
-from typing import Literal, TypedDict, Dict, List, Any
+import logging.handlers
+import operator
+import queue
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, Optional, TypedDict, Dict, List, Any
 from langgraph.graph import StateGraph, START, END
-from IPython.display import Image, display
+from langgraph.types import Command, Send
 import sys
 
+from common import viz
+
+# Directory graph images are written to: the one holding this module
+_OUT_DIR = Path(__file__).resolve().parent
+
+# Whether draw_mermaid_png works here: None until the first render attempt
+_MERMAID_OK: Optional[bool] = None
+
+# Number of log records buffered in memory before they are written to disk
+_LOG_BUFFER_RECORDS = 1024
+
+
 # Configure logging
+# Console records are written synchronously, so they never land in the
+# middle of an input() prompt. File records are only enqueued by the calling
+# thread; a background listener owns the file handler so disk writes stay off
+# the graph's hot path. File records are held in a MemoryHandler and written to the rotating log in
+# batches: when the buffer is full, when an ERROR is logged, and at exit. The
+# log file is opened lazily on the first flush.
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=_LOG_BUFFER_RECORDS,
+    flushLevel=logging.ERROR,
+    target=logging.handlers.RotatingFileHandler(
+        'conditional_graph/langgraph_agent.log',
+        maxBytes=10_000_000,
+        backupCount=3,
+        delay=True
+    )
+)
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_buffer)
+_log_listener.start()
+# atexit runs in reverse order: drain the queue first, then flush
+atexit.register(_log_buffer.flush)
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('conditional_graph/langgraph_agent.log')
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+# Bound logging methods used by the per-step node bodies
+_info = logger.info
+_debug = logger.debug
 
-class AgentState(TypedDict):
+
+@dataclass(slots=True)
+class AgentState:
     """
     State structure for the conditional graph agent.
     
-    This TypedDict defines the data structure that flows through the agent's
-    conditional processing pipeline, supporting two separate mathematical operations
-    on two pairs of numbers.
+    This slotted dataclass defines the data structure that flows through the
+    agent's conditional processing pipeline, supporting two separate
+    mathematical operations on two pairs of numbers. Nodes read fields as
+    attributes, which on a __slots__ class is a fixed-offset lookup rather
+    than a dict hash probe.
     
     Attributes:
         num1 (int): First number of the first pair
@@ -46,18 +95,83 @@ class AgentState(TypedDict):
         result1 (int): Result of the first operation
         result2 (int): Result of the second operation
     """
-    num1: int
-    num2: int
-    num3: int
-    num4: int
-    operation1: Literal["add","multiply"]
-    operation2: Literal["add","multiply"]
-    phase: Literal["first", "second"]
-    result1: int
-    result2: int
+    num1: int = 0
+    num2: int = 0
+    num3: int = 0
+    num4: int = 0
+    operation1: Literal["add","multiply"] = "add"
+    operation2: Literal["add","multiply"] = "add"
+    phase: Literal["first", "second"] = "first"
+    result1: int = 0
+    result2: int = 0
+
+
+class PairState(TypedDict):
+    """
+    Payload sent to pair_op for one number pair in the fan-out graph.
+    
+    Attributes:
+        a (int): First number of the pair
+        b (int): Second number of the pair
+        operation (Literal["add","multiply"]): Operation to apply
+        slot (Literal["result1","result2"]): AgentState field receiving the result
+    """
+    a: int
+    b: int
+    operation: Literal["add","multiply"]
+    slot: Literal["result1", "result2"]
+
+
+# Binary operators available to the operation nodes
+_OPS = {"add": operator.add, "multiply": operator.mul}
+
+# Conditional edge emitted by the routers for each operation
+_ROUTES = {"add": "add_node_operation", "multiply": "multiply_node_operation"}
+
+# Operand getter, result field, log label and next node used in each
+# processing phase
+_PHASE_FIELDS = {
+    "first": (operator.attrgetter("num1", "num2"), "result1", "Phase 1", "conditional_node2"),
+    "second": (operator.attrgetter("num3", "num4"), "result2", "Phase 2", END),
+}
+
+# Nodes an operation node can continue to
+_AfterOperation = Command[Literal["conditional_node2", "__end__"]]
+
+
+def _apply_operation(state: AgentState, operation: Literal["add","multiply"]) -> _AfterOperation:
+    """
+    Applies an operation to the number pair selected by the current phase.
+    
+    Shared implementation behind add_node and multiply_node. The phase picks
+    the operand and result fields and the next node from _PHASE_FIELDS, and
+    the operation picks the operator from _OPS, so a single registration of
+    each node serves both number pairs. Returning the next node with
+    Command(goto=...) routes the flow from inside the node, so no
+    conditional edge has to run after it.
+    
+    Args:
+        state (AgentState): Current state containing numbers and phase information
+        operation (Literal["add","multiply"]): Operation to apply
+        
+    Returns:
+        Command: Update storing the result for the current phase, going to
+        conditional_node2 after the first pair and END after the second
+        
+    Note:
+        The operands are validated once by _validate_numbers before the graph
+        is invoked, so no exception handling is needed here.
+    """
+    get_operands, result_key, label, next_node = _PHASE_FIELDS[state.phase]
+    a, b = get_operands(state)
+    _info("%s: Applying %s to numbers %s and %s", label, operation, a, b)
+    result = _OPS[operation](a, b)
+    if __debug__:
+        _debug("%s %s result: %s, continuing to %s", label, operation, result, next_node)
+    return Command(update={result_key: result}, goto=next_node)
 
 
-def add_node(state: AgentState) -> AgentState:
+def add_node(state: AgentState) -> _AfterOperation:
     """
     Performs addition operation based on the current processing phase.
     
@@ -69,7 +183,7 @@ def add_node(state: AgentState) -> AgentState:
         state (AgentState): Current state containing numbers and phase information
         
     Returns:
-        AgentState: Updated state with addition result stored
+        Command: Update with the addition result, routed to the next node
         
     Processing Logic:
         - Checks current phase to determine which numbers to add
@@ -77,31 +191,15 @@ def add_node(state: AgentState) -> AgentState:
         - Logs the operation for debugging purposes
         
     Example:
-        >>> state = {"num1": 5, "num2": 3, "phase": "first", ...}
+        >>> state = AgentState(num1=5, num2=3, phase="first")
         >>> result = add_node(state)
-        >>> result["result1"]
-        8
+        >>> result.update
+        {'result1': 8}
     """
-    try:
-        if state["phase"] == "first":
-            logger.info(f"Phase 1: Adding numbers {state['num1']} and {state['num2']}")
-            state["result1"] = state["num1"] + state["num2"]
-            logger.debug(f"First addition result: {state['result1']}")
-        elif state["phase"] == "second":
-            logger.info(f"Phase 2: Adding numbers {state['num3']} and {state['num4']}")
-            state["result2"] = state["num3"] + state["num4"]
-            logger.debug(f"Second addition result: {state['result2']}")
-    except Exception as e:
-        logger.error(f"Error in add_node: {str(e)}")
-        if state["phase"] == "first":
-            state["result1"] = 0
-        else:
-            state["result2"] = 0
-    
-    return state
+    return _apply_operation(state, "add")
 
 
-def multiply_node(state: AgentState) -> AgentState:
+def multiply_node(state: AgentState) -> _AfterOperation:
     """
     Performs multiplication operation based on the current processing phase.
     
@@ -113,7 +211,7 @@ def multiply_node(state: AgentState) -> AgentState:
         state (AgentState): Current state containing numbers and phase information
         
     Returns:
-        AgentState: Updated state with multiplication result stored
+        Command: Update with the multiplication result, routed to the next node
         
     Processing Logic:
         - Checks current phase to determine which numbers to multiply
@@ -121,36 +219,21 @@ def multiply_node(state: AgentState) -> AgentState:
         - Logs the operation for debugging purposes
         
     Example:
-        >>> state = {"num1": 5, "num2": 3, "phase": "first", ...}
+        >>> state = AgentState(num1=5, num2=3, phase="first")
         >>> result = multiply_node(state)
-        >>> result["result1"]
-        15
+        >>> result.update
+        {'result1': 15}
     """
-    try:
-        if state["phase"] == "first":
-            logger.info(f"Phase 1: Multiplying numbers {state['num1']} and {state['num2']}")
-            state["result1"] = state["num1"] * state["num2"]
-            logger.debug(f"First multiplication result: {state['result1']}")
-        elif state["phase"] == "second":
-            logger.info(f"Phase 2: Multiplying numbers {state['num3']} and {state['num4']}")
-            state["result2"] = state["num3"] * state["num4"]
-            logger.debug(f"Second multiplication result: {state['result2']}")
-    except Exception as e:
-        logger.error(f"Error in multiply_node: {str(e)}")
-        if state["phase"] == "first":
-            state["result1"] = 0
-        else:
-            state["result2"] = 0
-    
-    return state
+    return _apply_operation(state, "multiply")
 
 
 def conditional_node1(state: AgentState) -> str:
     """
-    First conditional routing node that determines the operation for the first pair.
+    Conditional entry point that determines the operation for the first pair.
     
-    This node sets the processing phase to "first" and routes to the appropriate
-    operation node based on operation1 parameter.
+    This router runs directly off START and routes to the appropriate
+    operation node based on operation1 parameter. The "first" phase is
+    already part of the initial state, so no separate node is needed to set it.
     
     Args:
         state (AgentState): Current state containing operation1 choice
@@ -159,37 +242,33 @@ def conditional_node1(state: AgentState) -> str:
         str: Node name to route to ("add_node" or "multiply_node")
         
     Routing Logic:
-        - Sets phase to "first" for first pair processing
         - Routes to "add_node" if operation1 is "add"
         - Routes to "multiply_node" if operation1 is "multiply"
         
     Example:
-        >>> state = {"operation1": "add", ...}
+        >>> state = AgentState(operation1="add")
         >>> route = conditional_node1(state)
         >>> route
-        "add_node"
+        "add_node_operation"
     """
-    logger.info("Processing conditional node 1 (first pair)")
-    state["phase"] = "first"
-    logger.debug(f"Phase set to: {state['phase']}")
-    
-    if state["operation1"] == "add":
-        logger.debug("Routing to addition operation for first pair")
-        return "add_node_operation"
-    elif state["operation1"] == "multiply":
-        logger.debug("Routing to multiplication operation for first pair")
-        return "multiply_node_operation"
-    else:
-        logger.warning(f"Unknown operation1: {state['operation1']}, defaulting to add")
+    _info("Processing conditional node 1 (first pair)")
+    operation = state.operation1
+    route = _ROUTES.get(operation)
+    if route is None:
+        logger.warning("Unknown operation1: %s, defaulting to add", operation)
         return "add_node_operation"
+    if __debug__:
+        _debug("Routing to %s for first pair", route)
+    return route
 
 
 def conditional_node2(state: AgentState) -> str:
     """
     Second conditional routing node that determines the operation for the second pair.
     
-    This node sets the processing phase to "second" and routes to the appropriate
-    operation node based on operation2 parameter.
+    This router picks the operation node for the second pair based on the
+    operation2 parameter. The phase itself is set to "second" by the
+    conditional_node2 node body, _set_phase_second.
     
     Args:
         state (AgentState): Current state containing operation2 choice
@@ -198,29 +277,83 @@ def conditional_node2(state: AgentState) -> str:
         str: Node name to route to ("add_node" or "multiply_node")
         
     Routing Logic:
-        - Sets phase to "second" for second pair processing
         - Routes to "add_node" if operation2 is "add"
         - Routes to "multiply_node" if operation2 is "multiply"
         
     Example:
-        >>> state = {"operation2": "multiply", ...}
+        >>> state = AgentState(operation2="multiply")
         >>> route = conditional_node2(state)
         >>> route
-        "multiply_node"
+        "multiply_node_operation"
     """
-    logger.info("Processing conditional node 2 (second pair)")
-    state["phase"] = "second"
-    logger.debug(f"Phase set to: {state['phase']}")
+    _info("Processing conditional node 2 (second pair)")
     
-    if state["operation2"] == "add":
-        logger.debug("Routing to addition operation for second pair")
-        return "add_node_operation"
-    elif state["operation2"] == "multiply":
-        logger.debug("Routing to multiplication operation for second pair")
-        return "multiply_node_operation"
-    else:
-        logger.warning(f"Unknown operation2: {state['operation2']}, defaulting to add")
+    operation = state.operation2
+    route = _ROUTES.get(operation)
+    if route is None:
+        logger.warning("Unknown operation2: %s, defaulting to add", operation)
         return "add_node_operation"
+    if __debug__:
+        _debug("Routing to %s for second pair", route)
+    return route
+
+
+def _set_phase_second(state: AgentState) -> Dict[str, str]:
+    """
+    Node body of conditional_node2: marks the start of second-pair processing.
+    
+    Returns only the partial update; LangGraph merges it into the state
+    without copying every field.
+    """
+    return {"phase": "second"}
+
+
+def fanout_pairs(state: AgentState) -> List[Send]:
+    """
+    Entry router of the fan-out graph that dispatches both pairs at once.
+    
+    The two pair computations are independent, so instead of routing them one
+    after the other this returns one Send per pair; LangGraph runs both
+    pair_op invocations in the same superstep.
+    
+    Args:
+        state (AgentState): Initial state containing both pairs and operations
+        
+    Returns:
+        List[Send]: One pair_op task per number pair
+    """
+    if __debug__:
+        _debug("Fanning out both pairs to pair_op")
+    return [
+        Send("pair_op", {"a": state.num1, "b": state.num2,
+                         "operation": state.operation1, "slot": "result1"}),
+        Send("pair_op", {"a": state.num3, "b": state.num4,
+                         "operation": state.operation2, "slot": "result2"}),
+    ]
+
+
+def pair_op_node(state: PairState) -> Dict[str, int]:
+    """
+    Applies one operation to one number pair and writes it to its result slot.
+    
+    Args:
+        state (PairState): Pair payload produced by fanout_pairs
+        
+    Returns:
+        Dict[str, int]: Partial update setting result1 or result2
+        
+    Example:
+        >>> pair_op_node({"a": 7, "b": 2, "operation": "multiply", "slot": "result2"})
+        {'result2': 14}
+    """
+    operation = state["operation"]
+    op = _OPS.get(operation)
+    if op is None:
+        logger.warning("Unknown operation: %s, defaulting to add", operation)
+        op = operator.add
+    result = op(state["a"], state["b"])
+    _info("Computed %s = %s via %s", state["slot"], result, operation)
+    return {state["slot"]: result}
 
 
 def create_agent_graph() -> StateGraph:
@@ -237,10 +370,19 @@ def create_agent_graph() -> StateGraph:
         Exception: If graph creation fails
         
     Graph Structure:
-        START → conditional_node1 → [add_node|multiply_node] → conditional_node2 → [add_node|multiply_node] → END
+        START ─(conditional_node1)→ [add_node|multiply_node] → conditional_node2 → [add_node|multiply_node] → END
+        
+        conditional_node1 is the conditional entry point, so the first pair is
+        routed without an extra superstep; the initial state already carries
+        phase="first".
+        
+        add_node and multiply_node are registered once and reused for the
+        second pair; they return Command(goto=...) to continue to
+        conditional_node2 or END depending on the phase, so each run
+        dispatches only the two conditional routers.
         
     Conditional Flow:
-        1. conditional_node1: Routes first pair based on operation1
+        1. conditional_node1 (entry router): Routes first pair based on operation1
         2. Operation node: Processes first pair (add or multiply)
         3. conditional_node2: Routes second pair based on operation2
         4. Operation node: Processes second pair (add or multiply)
@@ -260,22 +402,12 @@ def create_agent_graph() -> StateGraph:
         graph.add_node("multiply_node", multiply_node)
         logger.debug("Multiplication node added to graph")
 
-        # Add conditional routing nodes
-        set_phase_first = lambda state: {**state, "phase": "first"}
-        graph.add_node("conditional_node1", set_phase_first)
-        logger.debug("First conditional node added to graph")
-        
-        set_phase_second = lambda state: {**state, "phase": "second"}
-        graph.add_node("conditional_node2", set_phase_second)
+        # Add the second conditional routing node
+        graph.add_node("conditional_node2", _set_phase_second)
         logger.debug("Second conditional node added to graph")
         
-        # Configure conditional graph flow
-        graph.add_edge(START, "conditional_node1")
-        logger.debug("Entry point set to conditional_node1")
-        
-        # First conditional routing
-        graph.add_conditional_edges(
-            "conditional_node1",
+        # First conditional routing straight from START
+        graph.set_conditional_entry_point(
             conditional_node1,
             # Edge : Node
             {
@@ -283,19 +415,7 @@ def create_agent_graph() -> StateGraph:
                 "multiply_node_operation": "multiply_node"
             },
         )
-        logger.debug("First conditional edges configured")
-        
-        # Connect first operation to second conditional
-        graph.add_edge("add_node", "conditional_node2")
-        graph.add_edge("multiply_node", "conditional_node2")
-        logger.debug("Edges to second conditional node configured")
-
-        # Add second operation processing nodes
-        graph.add_node("add_node_2", add_node)
-        logger.debug("Addition node2 added to graph")
-        
-        graph.add_node("multiply_node_2", multiply_node)
-        logger.debug("Multiplication node2 added to graph")
+        logger.debug("Conditional entry point set to conditional_node1")
         
         # Second conditional routing
         graph.add_conditional_edges(
@@ -303,26 +423,88 @@ def create_agent_graph() -> StateGraph:
             conditional_node2,
             # Edge : Node
             {
-                "add_node_operation": "add_node_2",
-                "multiply_node_operation": "multiply_node_2"
+                "add_node_operation": "add_node",
+                "multiply_node_operation": "multiply_node"
             },
         )
         logger.debug("Second conditional edges configured")
         
-        # Set final endpoints
-        graph.add_edge("add_node_2", END)
-        graph.add_edge("multiply_node_2", END)
-        logger.debug("End points configured")
-        
         logger.info("Conditional agent graph created successfully")
         return graph
         
     except Exception as e:
-        logger.error(f"Failed to create conditional agent graph: {str(e)}")
+        logger.error("Failed to create conditional agent graph: %s", e)
         raise
 
 
-def save_graph_image(app, filename: str = "graph_visualization.png") -> str:
+def create_fanout_agent_graph() -> StateGraph:
+    """
+    Creates a variant of the agent graph that computes both pairs in parallel.
+    
+    The results are the same as create_agent_graph, but instead of the
+    sequential conditional_node1 → operation → conditional_node2 → operation
+    chain, fanout_pairs uses the Send API to dispatch both pairs to pair_op
+    in a single superstep. Each pair_op invocation writes a different result
+    field, so no reducer is needed to merge them.
+    
+    Returns:
+        StateGraph: Configured graph ready for compilation
+        
+    Raises:
+        Exception: If graph creation fails
+        
+    Graph Structure:
+        START → fanout_pairs ⇉ pair_op (×2, in parallel) → END
+    """
+    logger.info("Creating fan-out mathematical operations agent graph")
+    
+    try:
+        graph = StateGraph(AgentState)
+        graph.add_node("pair_op", pair_op_node)
+        graph.add_conditional_edges(START, fanout_pairs, ["pair_op"])
+        graph.add_edge("pair_op", END)
+        
+        logger.info("Fan-out agent graph created successfully")
+        return graph
+        
+    except Exception as e:
+        logger.error("Failed to create fan-out agent graph: %s", e)
+        raise
+
+
+def _display_image(png: bytes) -> None:
+    """
+    Displays PNG bytes inline in a notebook, if IPython is available.
+    
+    IPython is imported here rather than at module level so the CLI path
+    never pays for it, and headless installs don't need it at all.
+    """
+    try:
+        from IPython.display import Image, display
+    except ImportError:
+        logger.info("IPython not available, skipping inline graph display")
+        return
+    display(Image(png))
+
+
+@functools.lru_cache(maxsize=1)
+def get_compiled_app():
+    """
+    Returns the compiled conditional agent graph, building it on first use.
+    
+    The graph definition is fixed by this module, so compiling it once per
+    process and sharing the result makes repeated runs skip graph
+    construction and validation.
+    
+    Returns:
+        The compiled LangGraph application
+    """
+    app = create_agent_graph().compile()
+    logger.info("Conditional agent graph compiled successfully")
+    return app
+
+
+def save_graph_image(app, filename: str = "graph_visualization.png", show: bool = False) -> Optional[str]:
     """
     Saves the graph visualization to a file in the conditional_graph directory.
     
@@ -332,44 +514,142 @@ def save_graph_image(app, filename: str = "graph_visualization.png") -> str:
     Args:
         app: The compiled graph to visualize
         filename (str): Name of the file to save the image to
+        show (bool): Also display the image inline when running under IPython
         
     Returns:
-        str: Full path to the saved image file
-        
-    Raises:
-        Exception: If image generation or saving fails
+        Optional[str]: Full path to the saved image file, or None if rendering
+        was skipped or the visualization is unavailable
         
     File Location:
-        Saves to: ./conditional_graph/graph_visualization.png
+        Saves to: graph_visualization.png next to this module
+        
+    Caching:
+        Delegates to the shared common.viz.save_graph_image, which keys the
+        saved image on the SHA-256 of the graph's Mermaid source and returns
+        it without re-rendering while the graph is unchanged.
+        
+    Renderer Availability:
+        Set LG_SKIP_GRAPH_IMAGE=1 (e.g. in CI) to skip rendering entirely.
+        If rendering or saving fails once, the visualization is treated as
+        unavailable and later calls return None immediately instead of
+        retrying.
     """
-    logger.info("Generating and saving conditional graph visualization")
+    global _MERMAID_OK
+    
+    if _MERMAID_OK is False:
+        return None
     
     try:
-        # Create the conditional_graph directory if it doesn't exist
-        output_dir = os.path.join(os.getcwd(), "conditional_graph")
-        os.makedirs(output_dir, exist_ok=True)
-        logger.debug(f"Output directory ensured: {output_dir}")
+        filepath = viz.save_graph_image(app, _OUT_DIR, filename)
+    except Exception as e:
+        _MERMAID_OK = False
+        logger.warning("Graph visualization unavailable, disabled for this process: %s", e)
+        return None
+    _MERMAID_OK = True
+    
+    if filepath and show:
+        _display_image(Path(filepath).read_bytes())
+    return filepath
+
+
+def _validate_numbers(num1: int, num2: int, num3: int, num4: int) -> None:
+    """
+    Checks that all four operands are integers before a run starts.
+    
+    Raises:
+        TypeError: If any operand is not an int
+    """
+    for name, value in (("num1", num1), ("num2", num2), ("num3", num3), ("num4", num4)):
+        if not isinstance(value, int):
+            raise TypeError(f"{name} must be an int, got {type(value).__name__}")
+
+
+# Preallocated full state; _build_state copies it and overwrites the inputs
+_STATE_TEMPLATE = {
+    "num1": 0,
+    "num2": 0,
+    "num3": 0,
+    "num4": 0,
+    "operation1": "add",
+    "operation2": "add",
+    "phase": "first",
+    "result1": 0,
+    "result2": 0
+}
+
+
+def _build_state(num1: int, num2: int, num3: int, num4: int,
+                 operation1: Literal["add","multiply"],
+                 operation2: Literal["add","multiply"],
+                 phase: str = "first") -> Dict[str, Any]:
+    """
+    Builds a full agent state for the given inputs with zeroed results.
+    
+    Used for the initial state passed to the graph and, with phase="error",
+    for the state returned when a run fails.
+    """
+    state = _STATE_TEMPLATE.copy()
+    state["num1"] = num1
+    state["num2"] = num2
+    state["num3"] = num3
+    state["num4"] = num4
+    state["operation1"] = operation1
+    state["operation2"] = operation2
+    state["phase"] = phase
+    return state
+
+
+def run_agent_fast(num1: int, num2: int, num3: int, num4: int,
+                   operation1: Literal["add","multiply"],
+                   operation2: Literal["add","multiply"]) -> Dict[str, Any]:
+    """
+    Computes both pair results directly, without invoking the graph.
+    
+    The graph only performs two integer operations, so for batch or scripted
+    callers that just want the results the Pregel loop is pure overhead. This
+    applies the same _OPS table the operation nodes use and returns a state
+    shaped like the graph's final state.
+    
+    Args:
+        num1 (int): First number of the first pair
+        num2 (int): Second number of the first pair
+        num3 (int): First number of the second pair
+        num4 (int): Second number of the second pair
+        operation1 (Literal["add","multiply"]): Operation for first pair
+        operation2 (Literal["add","multiply"]): Operation for second pair
         
-        # Generate the Mermaid diagram as PNG bytes
-        mermaid_png = app.get_graph().draw_mermaid_png()
-        logger.debug("Mermaid diagram generated successfully")
+    Returns:
+        Dict[str, Any]: Final state containing both operation results
         
-        # Save to file in the conditional_graph directory
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, "wb") as f:
-            f.write(mermaid_png)
+    Raises:
+        TypeError: If any of num1..num4 is not an int
         
-        logger.info(f"Graph visualization saved to: {filepath}")
-        return filepath
+    Note:
+        Unknown operations default to "add", matching the conditional routers.
         
-    except Exception as e:
-        logger.error(f"Failed to save graph visualization: {str(e)}")
-        raise
+    Example:
+        >>> result = run_agent_fast(5, 3, 7, 2, "add", "multiply")
+        >>> result["result1"], result["result2"]
+        (8, 14)
+    """
+    _validate_numbers(num1, num2, num3, num4)
+    return {
+        "num1": num1,
+        "num2": num2,
+        "num3": num3,
+        "num4": num4,
+        "operation1": operation1,
+        "operation2": operation2,
+        "phase": "second",
+        "result1": _OPS.get(operation1, operator.add)(num1, num2),
+        "result2": _OPS.get(operation2, operator.add)(num3, num4),
+    }
 
 
 def run_agent(app, num1: int, num2: int, num3: int, num4: int, 
               operation1: Literal["add","multiply"], 
-              operation2: Literal["add","multiply"]) -> Dict[str, Any]:
+              operation2: Literal["add","multiply"],
+              use_graph: bool = True) -> Dict[str, Any]:
     """
     Executes the conditional graph agent with provided number pairs and operations.
     
@@ -384,11 +664,14 @@ def run_agent(app, num1: int, num2: int, num3: int, num4: int,
         num4 (int): Second number of the second pair
         operation1 (Literal["add","multiply"]): Operation for first pair
         operation2 (Literal["add","multiply"]): Operation for second pair
+        use_graph (bool): If False, skip the graph and compute the results
+            with run_agent_fast; app may then be None
         
     Returns:
         Dict[str, Any]: Agent state containing both operation results
         
     Raises:
+        TypeError: If any of num1..num4 is not an int
         Exception: If agent execution fails (caught and returned as error state)
         
     Processing Flow:
@@ -403,44 +686,163 @@ def run_agent(app, num1: int, num2: int, num3: int, num4: int,
         (8, 14)
     """
     logger.info("Running conditional agent")
-    logger.debug(f"Input parameters - Pair 1: ({num1}, {num2}) {operation1}, Pair 2: ({num3}, {num4}) {operation2}")
+    if __debug__:
+        logger.debug("Input parameters - Pair 1: (%s, %s) %s, Pair 2: (%s, %s) %s",
+                     num1, num2, operation1, num3, num4, operation2)
+    
+    _validate_numbers(num1, num2, num3, num4)
+    
+    if not use_graph:
+        result = run_agent_fast(num1, num2, num3, num4, operation1, operation2)
+        logger.info("Results (graph bypassed) - First: %s, Second: %s", result['result1'], result['result2'])
+        return result
     
     try:
         # Prepare the initial state with user inputs
-        initial_state = {
-            "num1": num1,
-            "num2": num2,
-            "num3": num3,
-            "num4": num4,
-            "operation1": operation1,
-            "operation2": operation2,
-            "phase": "first",
-            "result1": 0,
-            "result2": 0
-        }
-        logger.debug(f"Initial state prepared: {initial_state}")
+        initial_state = _build_state(num1, num2, num3, num4, operation1, operation2)
+        if __debug__:
+            logger.debug("Initial state prepared: %s", initial_state)
         
         # Execute the agent through conditional routing
         result = app.invoke(initial_state)
-        logger.info(f"Conditional agent execution completed successfully")
-        logger.info(f"Results - First: {result['result1']}, Second: {result['result2']}")
+        logger.info("Conditional agent execution completed successfully")
+        logger.info("Results - First: %s, Second: %s", result['result1'], result['result2'])
         
         return result
         
     except Exception as e:
-        logger.error(f"Error running conditional agent: {str(e)}")
+        logger.error("Error running conditional agent: %s", e)
         # Return error state instead of raising
-        return {
-            "num1": num1,
-            "num2": num2,
-            "num3": num3,
-            "num4": num4,
-            "operation1": operation1,
-            "operation2": operation2,
-            "phase": "error",
-            "result1": 0,
-            "result2": 0,
-        }
+        return _build_state(num1, num2, num3, num4, operation1, operation2, phase="error")
+
+
+async def run_agent_async(app, num1: int, num2: int, num3: int, num4: int,
+                          operation1: Literal["add","multiply"],
+                          operation2: Literal["add","multiply"]) -> Dict[str, Any]:
+    """
+    Asynchronous counterpart of run_agent using app.ainvoke.
+    
+    Args:
+        app: The compiled LangGraph application
+        num1 (int): First number of the first pair
+        num2 (int): Second number of the first pair
+        num3 (int): First number of the second pair
+        num4 (int): Second number of the second pair
+        operation1 (Literal["add","multiply"]): Operation for first pair
+        operation2 (Literal["add","multiply"]): Operation for second pair
+        
+    Returns:
+        Dict[str, Any]: Agent state containing both operation results
+        
+    Raises:
+        TypeError: If any of num1..num4 is not an int
+        Exception: If agent execution fails (caught and returned as error state)
+    """
+    if __debug__:
+        logger.debug("Running conditional agent asynchronously - Pair 1: (%s, %s) %s, Pair 2: (%s, %s) %s",
+                     num1, num2, operation1, num3, num4, operation2)
+    _validate_numbers(num1, num2, num3, num4)
+    
+    try:
+        initial_state = _build_state(num1, num2, num3, num4, operation1, operation2)
+        result = await app.ainvoke(initial_state)
+        logger.info("Results - First: %s, Second: %s", result['result1'], result['result2'])
+        return result
+        
+    except Exception as e:
+        logger.error("Error running conditional agent: %s", e)
+        return _build_state(num1, num2, num3, num4, operation1, operation2, phase="error")
+
+
+def run_agent_batch(app, jobs: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+    """
+    Runs many independent problems through the agent concurrently.
+    
+    Each job is a dict of run_agent keyword arguments (num1..num4,
+    operation1, operation2). The jobs are awaited together with
+    asyncio.gather, with at most max_concurrency graph runs in flight.
+    
+    Args:
+        app: The compiled LangGraph application
+        jobs (List[Dict[str, Any]]): Keyword arguments for each run
+        max_concurrency (int): Maximum number of simultaneous graph runs
+        
+    Returns:
+        List[Dict[str, Any]]: Final states, in the same order as jobs
+        
+    Note:
+        Uses asyncio.run, so it must be called from synchronous code; inside
+        a running event loop await run_agent_async directly instead.
+        
+    Example:
+        >>> jobs = [
+        ...     {"num1": 5, "num2": 3, "num3": 7, "num4": 2, "operation1": "add", "operation2": "multiply"},
+        ...     {"num1": 1, "num2": 2, "num3": 3, "num4": 4, "operation1": "multiply", "operation2": "add"},
+        ... ]
+        >>> [(r["result1"], r["result2"]) for r in run_agent_batch(app, jobs)]
+        [(8, 14), (2, 7)]
+    """
+    logger.info("Running conditional agent batch of %d jobs", len(jobs))
+    
+    async def _run_all() -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _run_one(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await run_agent_async(app, **job)
+        
+        return await asyncio.gather(*(_run_one(job) for job in jobs))
+    
+    return asyncio.run(_run_all())
+
+
+def run_agent_bulk(num1, num2, num3, num4, operation1, operation2) -> Dict[str, Any]:
+    """
+    Computes results for many problems at once with a compiled kernel.
+    
+    Each argument is an array-like with one entry per problem, so row i
+    describes the same inputs run_agent would take for a single problem. The
+    graph is bypassed; both operations are applied across the arrays by
+    _kernels.compute, which is Numba-compiled when Numba is available.
+    
+    Args:
+        num1, num2: First pair operands (array-likes of integers)
+        num3, num4: Second pair operands (array-likes of integers)
+        operation1, operation2: Per-row operations, either "add"/"multiply"
+            names or integer codes from _kernels.OP_CODES
+        
+    Returns:
+        Dict[str, Any]: "result1" and "result2" int64 arrays
+        
+    Note:
+        Requires NumPy. Results use int64 arithmetic, unlike the graph path
+        which uses Python integers.
+        
+    Example:
+        >>> results = run_agent_bulk([5, 1], [3, 2], [7, 3], [2, 4], ["add", "multiply"], ["multiply", "add"])
+        >>> results["result1"].tolist(), results["result2"].tolist()
+        ([8, 2], [14, 7])
+    """
+    import numpy as np
+    from conditional_graph._kernels import compute, encode_operations
+    
+    a = np.ascontiguousarray(num1, dtype=np.int64)
+    b = np.ascontiguousarray(num2, dtype=np.int64)
+    c = np.ascontiguousarray(num3, dtype=np.int64)
+    d = np.ascontiguousarray(num4, dtype=np.int64)
+    if not (a.size == b.size == c.size == d.size):
+        raise ValueError("All number arrays must have the same length")
+    op_a = encode_operations(operation1)
+    op_c = encode_operations(operation2)
+    if not (op_a.size == op_c.size == a.size):
+        raise ValueError("Operation arrays must match the number arrays in length")
+    
+    logger.info("Running conditional agent bulk computation for %d problems", a.size)
+    result1 = np.empty_like(a)
+    result2 = np.empty_like(c)
+    compute(a, b, op_a, c, d, op_c, result1, result2)
+    
+    return {"result1": result1, "result2": result2}
 
 
 def get_user_inputs() -> Dict[str, Any]:
@@ -484,27 +886,27 @@ def get_user_inputs() -> Dict[str, Any]:
         logger.info("Collecting first pair of numbers")
         num1 = int(input("Enter the first integer: ").strip())
         num2 = int(input("Enter the second integer: ").strip())
-        logger.debug(f"First pair: {num1}, {num2}")
+        logger.debug("First pair: %s, %s", num1, num2)
         
         # Collect operation for first pair
         operation1 = input("Enter operation for first pair (add/multiply): ").strip().lower()
         if operation1 not in ['add', 'multiply']:
-            logger.warning(f"Invalid operation '{operation1}', defaulting to 'add'")
+            logger.warning("Invalid operation '%s', defaulting to 'add'", operation1)
             operation1 = 'add'
-        logger.debug(f"First operation: '{operation1}'")
+        logger.debug("First operation: '%s'", operation1)
         
         # Collect integer values for second pair
         logger.info("Collecting second pair of numbers")
         num3 = int(input("Enter the third integer: ").strip())
         num4 = int(input("Enter the fourth integer: ").strip())
-        logger.debug(f"Second pair: {num3}, {num4}")
+        logger.debug("Second pair: %s, %s", num3, num4)
         
         # Collect operation for second pair
         operation2 = input("Enter operation for second pair (add/multiply): ").strip().lower()
         if operation2 not in ['add', 'multiply']:
-            logger.warning(f"Invalid operation '{operation2}', defaulting to 'add'")
+            logger.warning("Invalid operation '%s', defaulting to 'add'", operation2)
             operation2 = 'add'
-        logger.debug(f"Second operation: '{operation2}'")
+        logger.debug("Second operation: '%s'", operation2)
         
         # Prepare inputs dictionary
         inputs = {
@@ -516,14 +918,14 @@ def get_user_inputs() -> Dict[str, Any]:
             "operation2": operation2
         }
         
-        logger.info(f"User inputs collected successfully: 2 pairs, operations: {operation1}, {operation2}")
+        logger.info("User inputs collected successfully: 2 pairs, operations: %s, %s", operation1, operation2)
         return inputs
         
     except KeyboardInterrupt:
         logger.warning("User interrupted input collection")
         raise
     except ValueError as e:
-        logger.error(f"Invalid input provided: {str(e)}")
+        logger.error("Invalid input provided: %s", e)
         raise ValueError("Please enter valid integers and operations.") from e
 
 
@@ -554,14 +956,13 @@ def main() -> None:
     try:
         # Step 1: Create and compile the conditional agent graph
         logger.info("Step 1: Creating conditional agent graph")
-        graph = create_agent_graph()
-        app = graph.compile()
-        logger.info("Conditional agent graph compiled successfully")
+        app = get_compiled_app()
         
         # Step 2: Save graph visualization
         logger.info("Step 2: Saving graph visualization")
         image_path = save_graph_image(app)
-        logger.info(f"Graph visualization available at: {image_path}")
+        if image_path:
+            logger.info("Graph visualization available at: %s", image_path)
         
         # Step 3: Collect user inputs
         logger.info("Step 3: Collecting user inputs")
@@ -575,13 +976,13 @@ def main() -> None:
         logger.info("="*60)
         logger.info("CONDITIONAL AGENT EXECUTION SUMMARY")
         logger.info("="*60)
-        logger.info(f"First pair: {user_inputs['num1']} and {user_inputs['num2']}")
-        logger.info(f"First operation: {user_inputs['operation1']}")
-        logger.info(f"First result: {result['result1']}")
+        logger.info("First pair: %s and %s", user_inputs['num1'], user_inputs['num2'])
+        logger.info("First operation: %s", user_inputs['operation1'])
+        logger.info("First result: %s", result['result1'])
         logger.info("-"*30)
-        logger.info(f"Second pair: {user_inputs['num3']} and {user_inputs['num4']}")
-        logger.info(f"Second operation: {user_inputs['operation2']}")
-        logger.info(f"Second result: {result['result2']}")
+        logger.info("Second pair: %s and %s", user_inputs['num3'], user_inputs['num4'])
+        logger.info("Second operation: %s", user_inputs['operation2'])
+        logger.info("Second result: %s", result['result2'])
         logger.info("="*60)
         
         logger.info("Conditional graph agent completed successfully")
@@ -591,7 +992,7 @@ def main() -> None:
         print("\nApplication interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.critical(f"Conditional agent application failed: {str(e)}")
+        logger.critical("Conditional agent application failed: %s", e)
         print(f"An error occurred: {str(e)}")
         sys.exit(1)
 
@@ -0,0 +1,6 @@
+"""
+LangGraph looping (number guessing) graph example.
+
+Run from the repository root with: python -m looping_graph.main
+
+"""
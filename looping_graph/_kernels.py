@@ -0,0 +1,54 @@
+"""
+Compiled guessing kernel for the number guessing game.
+
+This module holds the pure numeric decision made by guess_node on every
+turn: narrow the search range using the previous guess and the user's
+feedback, then pick the midpoint of what remains. Logging and state
+handling stay in main.py; only integers cross this boundary.
+
+Numba is optional: when it is installed the kernel is compiled ahead of the
+first call (explicit signature) and cached on disk, so later process
+launches load it instantly. Without Numba the same function runs as plain
+Python.
+
+"""
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Integer phase codes used by the kernel
+NONE = 0
+HIGHER = 1
+LOWER = 2
+PHASE_CODES = {"none": NONE, "higher": HIGHER, "lower": LOWER}
+
+
+def _pick(lo, hi, prev_guess, phase_code):
+    """
+    Narrows the search range and picks the next guess.
+    
+    Args:
+        lo, hi: Current inclusive bounds of the search range
+        prev_guess: The previous guess
+        phase_code: HIGHER if the previous guess was too low, LOWER if it was
+            too high, NONE to keep the range unchanged
+            
+    Returns:
+        tuple: (lo, hi, guess) with the narrowed bounds and the midpoint
+        guess, or -1 as the guess when the range is empty (lo > hi)
+    """
+    if phase_code == HIGHER:
+        lo = max(lo, prev_guess + 1)
+    elif phase_code == LOWER:
+        hi = min(hi, prev_guess - 1)
+    if lo > hi:
+        return lo, hi, -1
+    return lo, hi, lo + (hi - lo) // 2
+
+
+if numba is not None:
+    pick = numba.njit("UniTuple(i8, 3)(i8, i8, i8, i8)", cache=True)(_pick)
+else:
+    pick = _pick
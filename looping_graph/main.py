@@ -8,37 +8,70 @@ until it finds the correct answer or exhausts available attempts.
 The game flow:
 1. Setup initial game parameters
 2. Make a guess
-3. Get user feedback (correct/higher/lower)
-4. Evaluate and loop back or end
+3. Pause for user feedback (correct/higher/lower); the graph is checkpointed
+   and resumed with the answer
+4. Loop back or end, as decided by the feedback node
 
 """
 
+import argparse
+import atexit
+import functools
 import logging
-import os
-from typing import Literal, TypedDict, Dict, List, Any
+import logging.handlers
+import queue
+import sqlite3
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal, Optional, Dict, List, Any
 from langgraph.graph import StateGraph, START, END
-from IPython.display import Image, display
+from langgraph.types import Command, interrupt
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
 import sys
 
+from common import viz
+
+# Skip thread/process introspection when building log records; the game
+# runs in a single thread and the log format does not use these fields
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Configure logging
+# Console output stays synchronous so log lines keep their place between the
+# game's prompts. File records are enqueued and written by a background
+# listener, keeping disk I/O off the game loop; the file opens on first use.
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('looping_graph/langgraph_agent.log', delay=True)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('looping_graph/langgraph_agent.log')
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 
 logger = logging.getLogger(__name__)
 
 
-class AgentState(TypedDict):
+@dataclass(slots=True)
+class AgentState:
     """
     State structure for the number guessing game agent.
     
-    This TypedDict defines the data structure that flows through the agent's
-    looping processing pipeline for the number guessing game.
+    This slotted dataclass defines the data structure that flows through the
+    agent's looping processing pipeline for the number guessing game. Nodes
+    read and update fields as attributes, which on a __slots__ class is a
+    fixed-offset lookup rather than a dict hash probe.
     
     Attributes:
         lower_bound (int): Lower boundary for number guessing range
@@ -51,15 +84,61 @@ class AgentState(TypedDict):
         target_number (int): The secret number to guess (for simulation)
         game_over (bool): Flag indicating if game has ended
     """
-    lower_bound: int 
-    upper_bound: int 
-    guess_num: int
-    guessed_nums: List[int]
-    attempts: int
-    count: int
-    phase: Literal["correct", "higher", "lower", "none"]
-    target_number: int
-    game_over: bool
+    lower_bound: int = 1
+    upper_bound: int = 20
+    guess_num: int = 0
+    guessed_nums: List[int] = field(default_factory=list)
+    attempts: int = 10
+    count: int = 0
+    phase: Literal["correct", "higher", "lower", "none"] = "none"
+    target_number: int = 0
+    game_over: bool = False
+
+
+# Maps every accepted feedback answer to the phase it puts the game in.
+# "high" means the guess was too high, so the next guess must be lower.
+_FEEDBACK_MAP: Dict[str, str] = {
+    'c': 'correct', 'correct': 'correct',
+    'h': 'lower', 'high': 'lower', 'higher': 'lower',
+    'l': 'higher', 'low': 'higher', 'lower': 'higher',
+}
+
+# Resume value that ends the game early (sent when the user presses Ctrl+C)
+_QUIT = "quit"
+
+# Game instructions shown once at startup
+_WELCOME_MSG = (
+    "\n" + "="*60 + "\n"
+    "🎮 WELCOME TO THE AI NUMBER GUESSING GAME! 🎮\n"
+    + "="*60 + "\n"
+    "🎯 Think of a number between 1 and 100\n"
+    "🤖 I'll try to guess it using smart strategies\n"
+    "💡 Give me feedback: (c)orrect, (h)igh, or (l)ow\n"
+    "⏱️  You have 10 attempts to help me find it!\n"
+    + "="*60 + "\n"
+)
+
+# Per-guess display, feedback prompt and invalid-answer message
+_GUESS_TEMPLATE = (
+    "\n🎯 My guess is: {guess}\n"
+    "📊 Attempt {count} of {attempts}\n"
+    "📋 Previous guesses: {previous}\n"
+)
+_PROMPT = "\n💭 Is my guess (c)orrect, too (h)igh, or too (l)ow? [c/h/l]: "
+_INVALID_MSG = "❌ Invalid input. Please enter 'c' for correct, 'h' for high, or 'l' for low."
+
+# Directory graph images are written to: the one holding this module
+_OUT_DIR = Path(__file__).resolve().parent
+
+# SQLite database holding checkpoints of paused games
+_CHECKPOINT_DB = 'looping_graph/agent_state.db'
+
+# Log message recorded for each phase chosen by the user
+_FEEDBACK_LOG: Dict[str, str] = {
+    'correct': "User confirmed: guess is correct!",
+    'lower': "User feedback: guess too high, need lower number",
+    'higher': "User feedback: guess too low, need higher number",
+}
 
 
 def setup_node(state: AgentState) -> AgentState:
@@ -82,37 +161,27 @@ def setup_node(state: AgentState) -> AgentState:
         - Sets initial phase to "none"
         
     Example:
-        >>> state = {}
+        >>> state = AgentState()
         >>> result = setup_node(state)
-        >>> result["lower_bound"], result["upper_bound"]
+        >>> result.lower_bound, result.upper_bound
         (1, 20)
     """
     logger.info("Setting up number guessing game")
     
-    try:
-        # Initialize the game parameters
-        state["lower_bound"] = 1
-        state["upper_bound"] = 20
-        state["guess_num"] = 0
-        state["guessed_nums"] = []
-        state["attempts"] = 10  # Maximum attempts allowed
-        state["count"] = 0  # Current attempt counter
-        state["phase"] = "none"
-        state["target_number"] = 0
-        state["game_over"] = False
-        
-        logger.info(f"Game setup completed - Range: {state['lower_bound']}-{state['upper_bound']}")
-        logger.info(f"Maximum attempts: {state['attempts']}")
-        logger.debug(f"Secret target number: {state['target_number']}")  # For debugging only
-       
-    except Exception as e:
-        logger.error(f"Error in setup_node: {str(e)}")
-        # Set safe defaults on error
-        state.update({
-            "lower_bound": 1, "upper_bound": 20, "guess_num": 0,
-            "guessed_nums": [], "attempts": 10, "count": 0,
-            "phase": "none", "target_number": 0, "game_over": False
-        })
+    # Initialize the game parameters
+    state.lower_bound = 1
+    state.upper_bound = 20
+    state.guess_num = 0
+    state.guessed_nums = []
+    state.attempts = 10  # Maximum attempts allowed
+    state.count = 0  # Current attempt counter
+    state.phase = "none"
+    state.target_number = 0
+    state.game_over = False
+    
+    logger.info("Game setup completed - Range: %s-%s", state.lower_bound, state.upper_bound)
+    logger.info("Maximum attempts: %s", state.attempts)
+    logger.debug("Secret target number: %s", state.target_number)  # For debugging only
     
     return state
 
@@ -122,9 +191,9 @@ def guess_node(state: AgentState) -> AgentState:
     Generates intelligent guesses based on previous feedback and game state.
     
     This node implements a smart guessing strategy that:
-    - Uses binary search approach for efficiency
-    - Avoids previously guessed numbers
-    - Adjusts search space based on "higher"/"lower" feedback
+    - Uses binary search: each guess is the midpoint of the remaining range
+    - Adjusts search space based on "higher"/"lower" feedback, which also
+      guarantees previously guessed numbers are never repeated
     
     Args:
         state (AgentState): Current game state with feedback and history
@@ -134,153 +203,91 @@ def guess_node(state: AgentState) -> AgentState:
         
     Guessing Strategy:
         - First guess: Middle of the range
-        - Subsequent guesses: Adjusted based on feedback
-        - Avoids duplicate guesses
-        - Handles edge cases when no valid numbers remain
+        - Subsequent guesses: Middle of the range narrowed by feedback
+        - Constant time and memory per guess (no candidate list is built)
+        - Ends the game when no valid numbers remain
         
     Example:
-        >>> state = {"lower_bound": 1, "upper_bound": 100, "guessed_nums": [], ...}
+        >>> state = AgentState(lower_bound=1, upper_bound=100)
         >>> result = guess_node(state)
-        >>> 1 <= result["guess_num"] <= 100
+        >>> 1 <= result.guess_num <= 100
         True
     """
-    logger.info(f"Making guess #{state['count'] + 1}")
+    logger.info("Making guess #%s", state.count + 1)
+    
+    # Imported on first use so loading this module doesn't pull in numba
+    from looping_graph._kernels import PHASE_CODES, pick
     
     try:
-        # Increment attempt counter
-        state["count"] += 1
+        # Bind the state fields used below to locals; they are written back once
+        guessed = state.guessed_nums
+        count = state.count + 1  # Increment attempt counter
+        attempts = state.attempts
         
-        if not state["guessed_nums"]:
-            # First guess: Use middle of range (binary search strategy)
-            state["guess_num"] = (state["lower_bound"] + state["upper_bound"]) // 2
+        if not guessed:
             logger.debug("First guess: using middle of range")
+            phase_code = PHASE_CODES["none"]
         else:
             # Subsequent guesses: Adjust based on feedback
-            if state["phase"] == "higher":
-                # Previous guess was too low, adjust lower bound
-                state["lower_bound"] = max(state["lower_bound"], state["guess_num"] + 1)
-                logger.debug(f"Adjusting lower bound to {state['lower_bound']}")
-            elif state["phase"] == "lower":
-                # Previous guess was too high, adjust upper bound
-                state["upper_bound"] = min(state["upper_bound"], state["guess_num"] - 1)
-                logger.debug(f"Adjusting upper bound to {state['upper_bound']}")
-            
-            # Generate available numbers in the adjusted range
-            available_numbers = [
-                num for num in range(state["lower_bound"], state["upper_bound"] + 1) 
-                if num not in state["guessed_nums"]
-            ]
-            
-            if available_numbers:
-                # Use binary search approach: pick middle of available range
-                state["guess_num"] = available_numbers[len(available_numbers) // 2]
-                logger.debug(f"New guess from {len(available_numbers)} available numbers")
-            else:
-                logger.warning("No more available numbers to guess - game should end")
-                state["game_over"] = True
-                return state
+            phase_code = PHASE_CODES.get(state.phase, PHASE_CODES["none"])
+        
+        # Binary search: narrow the range from the feedback and guess its
+        # midpoint. Every previous guess lies outside the narrowed range, so
+        # the midpoint is never a repeat.
+        lo, hi, guess = pick(state.lower_bound, state.upper_bound, state.guess_num, phase_code)
+        logger.debug("Search range now %s-%s", lo, hi)
+        
+        if lo > hi:
+            logger.warning("No more available numbers to guess - game should end")
+            state.lower_bound, state.upper_bound, state.count = lo, hi, count
+            state.game_over = True
+            return state
         
         # Record the guess
-        state["guessed_nums"].append(state["guess_num"])
+        guessed.append(guess)
+        
+        logger.info("Guess #%s: %s", count, guess)
+        logger.debug("Guessed numbers so far: %s", guessed)
+        logger.debug("Current range: %s-%s", lo, hi)
         
-        logger.info(f"Guess #{state['count']}: {state['guess_num']}")
-        logger.debug(f"Guessed numbers so far: {state['guessed_nums']}")
-        logger.debug(f"Current range: {state['lower_bound']}-{state['upper_bound']}")
+        state.lower_bound, state.upper_bound = lo, hi
+        state.count, state.guess_num = count, guess
         
         # Check if maximum attempts reached
-        if state["count"] >= state["attempts"]:
+        if count >= attempts:
             logger.warning("Maximum attempts reached")
-            state["game_over"] = True
+            state.game_over = True
             
     except Exception as e:
-        logger.error(f"Error in guess_node: {str(e)}")
-        state["game_over"] = True
+        logger.error("Error in guess_node: %s", e)
+        state.game_over = True
     
     return state
 
 
-def get_feedback_node(state: AgentState) -> AgentState:
+def get_feedback_node(state: AgentState) -> Command[Literal["guess_node", "get_feedback_node", "__end__"]]:
     """
-    Collects user feedback about the current guess.
+    Pauses for user feedback about the current guess and decides whether to loop.
     
-    This node prompts the user for feedback about whether the guess
-    is correct, too high, or too low, and updates the game state accordingly.
+    This node calls interrupt() with the current guess, which checkpoints
+    the game and suspends the graph until a driver resumes it with
+    Command(resume=<feedback>). On resume the answer is checked, the end
+    conditions are evaluated, and a Command carrying both the state update
+    and the next node is returned.
     
     Args:
         state (AgentState): Current state with the latest guess
         
     Returns:
-        AgentState: Updated state with user feedback in the phase field
+        Command: Update with the user's feedback in the phase field (and the
+        game_over flag), routed to guess_node to continue or END to finish.
+        Unrecognised feedback routes back to this node to ask again.
         
     User Feedback Options:
         - "correct": Guess is right, game ends
         - "higher": Guess too low, need higher number
         - "lower": Guess too high, need lower number
-        
-    Example:
-        >>> state = {"guess_num": 50, "phase": "none", ...}
-        >>> # User inputs "higher"
-        >>> result = get_feedback_node(state)
-        >>> result["phase"]
-        "higher"
-    """
-    logger.info(f"Getting feedback for guess: {state['guess_num']}")
-    
-    try:
-        # Display current guess to user
-        print(f"\n🎯 My guess is: {state['guess_num']}")
-        print(f"📊 Attempt {state['count']} of {state['attempts']}")
-        print(f"📋 Previous guesses: {state['guessed_nums'][:-1] if len(state['guessed_nums']) > 1 else 'None'}")
-        
-        # Get user feedback
-        while True:
-            feedback = input("\n💭 Is my guess (c)orrect, too (h)igh, or too (l)ow? [c/h/l]: ").strip().lower()
-            
-            if feedback in ['c', 'correct']:
-                state["phase"] = "correct"
-                logger.info("User confirmed: guess is correct!")
-                break
-            elif feedback in ['h', 'high', 'higher']:
-                state["phase"] = "lower"  # Guess was too high, need lower
-                logger.info("User feedback: guess too high, need lower number")
-                break
-            elif feedback in ['l', 'low', 'lower']:
-                state["phase"] = "higher"  # Guess was too low, need higher
-                logger.info("User feedback: guess too low, need higher number")
-                break
-            else:
-                print("❌ Invalid input. Please enter 'c' for correct, 'h' for high, or 'l' for low.")
-        
-        logger.debug(f"Phase updated to: {state['phase']}")
-        
-    except KeyboardInterrupt:
-        logger.info("User interrupted the game")
-        state["phase"] = "correct"  # End game gracefully
-        state["game_over"] = True
-    except Exception as e:
-        logger.error(f"Error in get_feedback_node: {str(e)}")
-        state["phase"] = "correct"  # End game on error
-        state["game_over"] = True
-    
-    return state
-
-
-def evaluation_function(state: AgentState) -> str:
-    """
-    Evaluates the current game state to determine next action.
-    
-    This function acts as a routing condition to determine whether
-    the game should continue looping or end based on the current state.
-    
-    Args:
-        state (AgentState): Current game state with feedback and counters
-        
-    Returns:
-        str: Next node to route to ("continue" or "end")
-        
-    Routing Logic:
-        - "end": If guess is correct, max attempts reached, or game_over flag set
-        - "continue": If game should continue with more guesses
+        - "quit": The user stopped the game, which ends it
         
     End Conditions:
         1. Correct guess found
@@ -289,37 +296,50 @@ def evaluation_function(state: AgentState) -> str:
         4. Game over flag set
         
     Example:
-        >>> state = {"phase": "correct", ...}
-        >>> evaluation_function(state)
-        "end"
+        >>> config = {"configurable": {"thread_id": "t1"}}
+        >>> app.invoke(AgentState(), config)  # Pauses at the first guess
+        >>> app.invoke(Command(resume="l"), config)  # Guess was too low
     """
-    logger.info("Evaluating game state for continuation")
+    logger.info("Getting feedback for guess: %s", state.guess_num)
     
-    try:
-        # Check various end conditions
-        if state["phase"] == "correct":
-            logger.info("Game ending: Correct guess found!")
-            return "end"
-        
-        if state["count"] >= state["attempts"]:
-            logger.info("😞 Game ending: Maximum attempts reached")
-            return "end"
-        
-        if state.get("game_over", False):
-            logger.info("🛑 Game ending: Game over flag set")
-            return "end"
-        
-        if state["lower_bound"] > state["upper_bound"]:
-            logger.info("😵 Game ending: No valid numbers remaining")
-            return "end"
-        
+    guessed = state.guessed_nums
+    feedback = interrupt({
+        "guess": state.guess_num,
+        "count": state.count,
+        "attempts": state.attempts,
+        "previous_guesses": guessed[:-1],
+    })
+    
+    game_over = state.game_over
+    if feedback == _QUIT:
+        logger.info("User interrupted the game")
+        phase = "correct"  # End game gracefully
+        game_over = True
+    else:
+        phase = _FEEDBACK_MAP.get(str(feedback).strip().lower())
+        if phase is None:
+            logger.warning("Invalid feedback %r, asking again", feedback)
+            return Command(goto="get_feedback_node")
+        logger.info(_FEEDBACK_LOG[phase])
+    
+    logger.debug("Phase updated to: %s", phase)
+    update = {"phase": phase, "game_over": game_over}
+    
+    # Check various end conditions
+    if phase == "correct":
+        logger.info("Game ending: Correct guess found!")
+    elif state.count >= state.attempts:
+        logger.info("😞 Game ending: Maximum attempts reached")
+    elif game_over:
+        logger.info("🛑 Game ending: Game over flag set")
+    elif state.lower_bound > state.upper_bound:
+        logger.info("😵 Game ending: No valid numbers remaining")
+    else:
         # Game continues
         logger.info(" Game continuing: Making another guess")
-        return "continue"
-       
-    except Exception as e:
-        logger.error(f"Error in evaluation_function: {str(e)}")
-        return "end"  # End game on error
+        return Command(update=update, goto="guess_node")
+    
+    return Command(update=update, goto=END)
 
 
 def create_agent_graph() -> StateGraph:
@@ -336,17 +356,15 @@ def create_agent_graph() -> StateGraph:
         Exception: If graph creation fails
         
     Graph Structure:
-        START → setup_node → guess_node → get_feedback_node → evaluation_function
-                                ↑                                      ↓
-                                └── continue ← [end condition check] ←┘
-                                                      ↓
-                                                    END
+        START → setup_node → guess_node → get_feedback_node ─→ END
+                                ↑                  │
+                                └──── continue ────┘
         
     Loop Logic:
         - Setup initializes game parameters
         - Guess generates intelligent guesses
-        - Feedback collects user input
-        - Evaluation determines whether to loop or end
+        - Feedback pauses for user input via interrupt(), checks the end
+          conditions and returns a Command routing back to guess_node or END
     """
     logger.info("Creating number guessing game graph with looping logic")
     
@@ -370,80 +388,137 @@ def create_agent_graph() -> StateGraph:
         graph.add_edge("setup_node", "guess_node")
         graph.add_edge("guess_node", "get_feedback_node")
         logger.debug("Linear flow configured: setup → guess → feedback")
-        
-        # Add conditional looping logic
-        graph.add_conditional_edges(
-            "get_feedback_node",
-            evaluation_function,
-            {
-                "continue": "guess_node",  # Loop back to make another guess
-                "end": END                 # End the game
-            },
-        )
-        logger.debug("Conditional looping edges configured")
+        # get_feedback_node routes itself with Command(goto=...); its return
+        # annotation declares the guess_node/END targets for the graph drawing
 
         logger.info("Number guessing game graph created successfully")
         return graph
         
     except Exception as e:
-        logger.error(f"Failed to create agent graph: {str(e)}")
+        logger.error("Failed to create agent graph: %s", e)
         raise
 
 
-def save_graph_image(app, filename: str = "graph_visualization.png") -> str:
+def _get_checkpointer() -> SqliteSaver:
+    """
+    Opens the SQLite checkpointer that persists paused games.
+    
+    The connection is shared with LangGraph's worker threads, so it is
+    opened with check_same_thread=False, and it is closed at exit.
+    
+    Returns:
+        SqliteSaver: Checkpointer backed by looping_graph/agent_state.db
+    """
+    conn = sqlite3.connect(_CHECKPOINT_DB, check_same_thread=False)
+    atexit.register(conn.close)
+    logger.debug("Checkpoint database opened: %s", _CHECKPOINT_DB)
+    return SqliteSaver(conn)
+
+
+@functools.lru_cache(maxsize=1)
+def get_compiled_app():
+    """
+    Returns the compiled number guessing game graph, building it on first use.
+    
+    The graph definition is fixed by this module, so compiling it once per
+    process and sharing the result lets drivers that play several rounds
+    skip graph construction and validation after the first game. Pausing
+    at get_feedback_node needs a checkpointer, so the graph is compiled
+    with an in-memory one: games last only as long as the process. Use
+    get_checkpointed_app for games that should survive it.
+    
+    Returns:
+        The compiled LangGraph application
+    """
+    app = create_agent_graph().compile(checkpointer=InMemorySaver())
+    logger.info("Number guessing game graph compiled successfully")
+    return app
+
+
+@functools.lru_cache(maxsize=1)
+def get_checkpointed_app():
+    """
+    Returns the game graph compiled with the SQLite checkpointer.
+    
+    Games played on this app under a thread_id are saved in
+    looping_graph/agent_state.db at every pause, so a game that was cut
+    off can be resumed by a later run with the same id.
+    
+    Returns:
+        The compiled LangGraph application
+    """
+    app = create_agent_graph().compile(checkpointer=_get_checkpointer())
+    logger.info("Checkpointed number guessing game graph compiled successfully")
+    return app
+
+
+def save_graph_image(app, filename: str = "graph_visualization.png") -> Optional[str]:
     """
     Saves the graph visualization to a file in the looping_graph directory.
     
-    This function generates a Mermaid diagram representation of the looping
-    graph structure and saves it as a PNG image for visualization purposes.
+    Delegates to the shared common.viz.save_graph_image, which reuses the
+    rendered PNG for an unchanged graph within the process and across runs.
     
     Args:
         app: The compiled graph to visualize
         filename (str): Name of the file to save the image to
         
     Returns:
-        str: Full path to the saved image file
+        Optional[str]: Full path to the saved image file, or None if
+        rendering was skipped (LG_SKIP_GRAPH_IMAGE=1)
         
     Raises:
         Exception: If image generation or saving fails
+    """
+    return viz.save_graph_image(app, _OUT_DIR, filename)
+
+
+def _prompt_feedback(payload: Dict[str, Any]) -> str:
+    """
+    Shows a paused game's current guess and asks the user for feedback.
+    
+    Args:
+        payload (Dict[str, Any]): Interrupt value from get_feedback_node
         
-    File Location:
-        Saves to: ./looping_graph/graph_visualization.png
+    Returns:
+        str: A feedback answer accepted by _FEEDBACK_MAP, or _QUIT if the
+        user pressed Ctrl+C
     """
-    logger.info("Generating and saving looping graph visualization")
+    # Display current guess to user in a single write
+    sys.stdout.write(_GUESS_TEMPLATE.format(
+        guess=payload["guess"],
+        count=payload["count"],
+        attempts=payload["attempts"],
+        previous=payload["previous_guesses"] or "None",
+    ))
     
     try:
-        # Create the looping_graph directory if it doesn't exist
-        output_dir = os.path.join(os.getcwd(), "looping_graph")
-        os.makedirs(output_dir, exist_ok=True)
-        logger.debug(f"Output directory ensured: {output_dir}")
-        
-        # Generate the Mermaid diagram as PNG bytes
-        mermaid_png = app.get_graph().draw_mermaid_png()
-        logger.debug("Mermaid diagram generated successfully")
-        
-        # Save to file in the looping_graph directory
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, "wb") as f:
-            f.write(mermaid_png)
-        
-        logger.info(f"Graph visualization saved to: {filepath}")
-        return filepath
-        
-    except Exception as e:
-        logger.error(f"Failed to save graph visualization: {str(e)}")
-        raise
+        # Get user feedback
+        while True:
+            feedback = input(_PROMPT).strip().lower()
+            if feedback in _FEEDBACK_MAP:
+                return feedback
+            print(_INVALID_MSG)
+    except KeyboardInterrupt:
+        return _QUIT
 
 
-def run_agent(app) -> Dict[str, Any]:
+def run_agent(app, thread_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Executes the number guessing game agent.
     
-    This function starts the game by invoking the compiled graph
-    with initial state and runs until completion.
+    This function starts the game by invoking the compiled graph with an
+    initial state, then drives it through each pause at get_feedback_node:
+    the user's answer is collected here and passed back with
+    Command(resume=...) until the graph reaches END.
     
     Args:
-        app: The compiled LangGraph application
+        app: The compiled LangGraph application (with a checkpointer)
+        thread_id (Optional[str]): Checkpoint thread of the game. A new
+            thread is created when omitted; passing the id of a paused game
+            resumes it instead of starting over. The thread's checkpoints
+            are deleted once the game ends, so finished games leave nothing
+            behind.
         
     Returns:
         Dict[str, Any]: Final game state with results
@@ -452,12 +527,12 @@ def run_agent(app) -> Dict[str, Any]:
         Exception: If agent execution fails (caught and returned as error state)
         
     Game Flow:
-        1. Initialize empty state
-        2. Execute through setup → guess → feedback loop
+        1. Initialize empty state (or pick up a paused game)
+        2. Execute through setup → guess → feedback loop, resuming each pause
         3. Return final state with game statistics
         
     Example:
-        >>> app = create_agent_graph().compile()
+        >>> app = get_compiled_app()
         >>> result = run_agent(app)
         >>> result["count"]  # Number of attempts made
         5
@@ -465,35 +540,42 @@ def run_agent(app) -> Dict[str, Any]:
     logger.info("Starting number guessing game")
     
     try:
-        # Prepare empty initial state (setup_node will initialize)
-        initial_state = AgentState(
-            lower_bound=1,
-            upper_bound=20,
-            guess_num=0,
-            guessed_nums=[],
-            attempts=10,
-            count=0,
-            phase="none",
-            target_number=0,
-            game_over=False
-        )
-        logger.debug("Initial empty state prepared")
-        
-        # Execute the game loop
-        result = app.invoke(initial_state)
+        thread_id = thread_id or uuid.uuid4().hex
+        config = {"configurable": {"thread_id": thread_id}}
+        
+        snapshot = app.get_state(config)
+        if snapshot.next:
+            logger.info("Resuming paused game: %s", thread_id)
+            result = snapshot.values
+        else:
+            # Empty initial state: setup_node sets every field on its first step
+            initial_state: Dict[str, Any] = {}
+            
+            # Run until the first pause for feedback
+            result = app.invoke(initial_state, config)
+            snapshot = app.get_state(config)
+        
+        # Execute the game loop, resuming the graph with each answer
+        while snapshot.next:
+            payload = snapshot.tasks[0].interrupts[0].value
+            result = app.invoke(Command(resume=_prompt_feedback(payload)), config)
+            snapshot = app.get_state(config)
         logger.info("Number guessing game completed successfully")
         
+        # The game is over, so its checkpoints can never be resumed
+        app.checkpointer.delete_thread(thread_id)
+        
         # Log game statistics
-        logger.info(f"Game Statistics:")
-        logger.info(f"  Total attempts: {result['count']}")
-        logger.info(f"  Final guess: {result['guess_num']}")
-        logger.info(f"  Game outcome: {'Won' if result['phase'] == 'correct' else 'Lost/Incomplete'}")
-        logger.info(f"  All guesses: {result['guessed_nums']}")
+        logger.info("Game Statistics:")
+        logger.info("  Total attempts: %s", result['count'])
+        logger.info("  Final guess: %s", result['guess_num'])
+        logger.info("  Game outcome: %s", 'Won' if result['phase'] == 'correct' else 'Lost/Incomplete')
+        logger.info("  All guesses: %s", result['guessed_nums'])
         
         return result
         
     except Exception as e:
-        logger.error(f"Error running number guessing agent: {str(e)}")
+        logger.error("Error running number guessing agent: %s", e)
         # Return error state
         return {
             "error": str(e),
@@ -509,6 +591,25 @@ def run_agent(app) -> Dict[str, Any]:
         }
 
 
+def _parse_args() -> argparse.Namespace:
+    """
+    Parses the command-line options for main().
+    
+    Games are only saved to disk when --thread-id is given; running again
+    with the same id resumes the game if it was cut off mid-way.
+    
+    Returns:
+        argparse.Namespace: The parsed options
+    """
+    parser = argparse.ArgumentParser(description="Play the LangGraph number guessing game.")
+    parser.add_argument(
+        "--thread-id",
+        help="save the game in looping_graph/agent_state.db under this id; "
+             "reusing the id of an unfinished game resumes it"
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """
     Main function that orchestrates the entire number guessing game workflow.
@@ -529,6 +630,7 @@ def main() -> None:
     Raises:
         Exception: For any unhandled errors during execution
     """
+    args = _parse_args()
     logger.info("="*60)
     logger.info("STARTING LANGGRAPH NUMBER GUESSING GAME")
     logger.info("="*60)
@@ -536,52 +638,43 @@ def main() -> None:
     try:
         # Step 1: Create and compile the game graph
         logger.info("Step 1: Creating number guessing game graph")
-        graph = create_agent_graph()
-        app = graph.compile()
-        logger.info("Number guessing game graph compiled successfully")
+        app = get_checkpointed_app() if args.thread_id else get_compiled_app()
         
         # Step 2: Save graph visualization
         logger.info("Step 2: Saving graph visualization")
         image_path = save_graph_image(app)
-        logger.info(f"Graph visualization available at: {image_path}")
+        if image_path:
+            logger.info("Graph visualization available at: %s", image_path)
         
         # Step 3: Display game instructions
-        print("\n" + "="*60)
-        print("🎮 WELCOME TO THE AI NUMBER GUESSING GAME! 🎮")
-        print("="*60)
-        print("🎯 Think of a number between 1 and 100")
-        print("🤖 I'll try to guess it using smart strategies")
-        print("💡 Give me feedback: (c)orrect, (h)igh, or (l)ow")
-        print("⏱️  You have 10 attempts to help me find it!")
-        print("="*60)
+        sys.stdout.write(_WELCOME_MSG)
         
         input("\n📝 Press Enter when you've thought of your number...")
         
         # Step 4: Execute the game
         logger.info("Step 4: Starting interactive game")
-        result = run_agent(app)
+        result = run_agent(app, thread_id=args.thread_id)
         
         # Step 5: Display comprehensive results
-        print("\n" + "="*60)
-        print("🎯 GAME RESULTS")
-        print("="*60)
+        lines = ["", "="*60, "🎯 GAME RESULTS", "="*60]
         
         if result["phase"] == "correct":
-            print(f" SUCCESS! I guessed your number: {result['guess_num']}")
-            print(f"📊 It took me {result['count']} attempts")
+            lines.append(f" SUCCESS! I guessed your number: {result['guess_num']}")
+            lines.append(f"📊 It took me {result['count']} attempts")
         else:
-            print(f"😞 Game ended without finding the number")
-            print(f"📊 I made {result['count']} attempts")
-            print(f"🔢 My last guess was: {result['guess_num']}")
+            lines.append("😞 Game ended without finding the number")
+            lines.append(f"📊 I made {result['count']} attempts")
+            lines.append(f"🔢 My last guess was: {result['guess_num']}")
         
-        print(f"📋 All my guesses: {result['guessed_nums']}")
-        print(f"🎯 Final search range: {result['lower_bound']}-{result['upper_bound']}")
+        lines.append(f"📋 All my guesses: {result['guessed_nums']}")
+        lines.append(f"🎯 Final search range: {result['lower_bound']}-{result['upper_bound']}")
         
         # Performance evaluation
         efficiency = (result['count'] / result['attempts']) * 100 if result['attempts'] > 0 else 0
-        print(f"⚡ Efficiency: {efficiency:.1f}% of available attempts used")
+        lines.append(f"⚡ Efficiency: {efficiency:.1f}% of available attempts used")
         
-        print("="*60)
+        lines.append("="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
         
         logger.info("Number guessing game application completed successfully")
         
@@ -590,7 +683,7 @@ def main() -> None:
         print("\n\n👋 Thanks for playing! Game interrupted by user.")
         sys.exit(0)
     except Exception as e:
-        logger.critical(f"Game application failed: {str(e)}")
+        logger.critical("Game application failed: %s", e)
         print(f"\n❌ An error occurred: {str(e)}")
         sys.exit(1)
 
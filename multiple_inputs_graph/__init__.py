@@ -0,0 +1,6 @@
+"""
+LangGraph multiple inputs graph example.
+
+Run from the repository root with: python -m multiple_inputs_graph.main
+
+"""
@@ -0,0 +1,100 @@
+"""
+Compiled reduction kernel for the multiple inputs agent.
+
+This module holds the numeric core of operation_node: the sum or product of
+the user's list of integers. When Numba is installed the values are packed
+into an int64 array and folded by a compiled loop; the kernel is compiled
+ahead of the first call (explicit signature) and cached on disk, so later
+process launches load it instantly.
+
+The kernel checks every step for int64 overflow. When a result would not
+fit, or Numba/NumPy are not installed, the reduction falls back to the
+builtin sum/math.prod, which work on Python's arbitrary-precision ints.
+
+"""
+
+import math
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+# Integer operation codes used by the kernel
+ADD = 0
+MULTIPLY = 1
+OP_CODES = {"add": ADD, "multiply": MULTIPLY}
+
+_I64_MAX = 2**63 - 1
+_I64_MIN = -2**63
+
+
+def _reduce(arr, op):
+    """
+    Folds an int64 array with addition or multiplication.
+    
+    Args:
+        arr: Values to reduce (int64 array)
+        op: ADD or MULTIPLY
+        
+    Returns:
+        tuple: (result, ok) where ok is False if an intermediate result
+        overflowed int64, in which case result is meaningless
+    """
+    if op == ADD:
+        total = 0
+        for v in arr:
+            if (v > 0 and total > _I64_MAX - v) or (v < 0 and total < _I64_MIN - v):
+                return 0, False
+            total += v
+        return total, True
+    
+    product = 1
+    for v in arr:
+        if v == 0:
+            return 0, True
+        if v == _I64_MIN or abs(product) > _I64_MAX // abs(v):
+            return 0, False
+        product *= v
+    return product, True
+
+
+if numba is not None:
+    _compiled_reduce = numba.njit("Tuple((i8, b1))(i8[:], i8)", cache=True)(_reduce)
+else:
+    _compiled_reduce = None
+
+
+def reduce_values(values, operation: str) -> int:
+    """
+    Returns the sum or product of a sequence of integers.
+    
+    Args:
+        values: Sequence of integers (list or integer array)
+        operation (str): "add" or "multiply"
+        
+    Returns:
+        int: The exact sum or product
+    """
+    if _compiled_reduce is not None:
+        try:
+            arr = np.ascontiguousarray(values, dtype=np.int64)
+        except OverflowError:
+            arr = None
+        if arr is not None:
+            result, ok = _compiled_reduce(arr, OP_CODES[operation])
+            if ok:
+                return int(result)
+    
+    if hasattr(values, "tolist"):
+        # An array sum can't overflow int64 while n * max|v| fits, so NumPy's
+        # own loop is exact there; otherwise reduce Python ints instead
+        if operation == "add" and values.size:
+            bound = max(int(values.max()), -int(values.min()))
+            if bound <= _I64_MAX // values.size:
+                return int(values.sum())
+        values = values.tolist()
+    if operation == "add":
+        return sum(values)
+    return math.prod(values)
@@ -7,25 +7,57 @@ It includes proper logging, state management, and graph visualization.
 
 """
 
+import functools
 import logging
-import os
-from typing import TypedDict, Dict, List, Any
-from langgraph.graph import StateGraph
-from IPython.display import Image, display
+import logging.handlers
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence, TypedDict, Dict, List, Any, Union
 import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# NumPy, the compiled kernels and LangGraph are imported where they are first
+# used, so importing this module stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    from langgraph.graph import StateGraph
 
 # Configure logging
+# Console records use a short format with no timestamp, so no strftime runs
+# per line. Only WARNING and above go to the log file, which keeps the full
+# timestamped format; it is rotated at 10 MB and opened on the first write.
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+
+_file_handler = logging.handlers.RotatingFileHandler(
+    'multiple_inputs_graph/langgraph_agent.log',
+    maxBytes=10_000_000,
+    backupCount=3,
+    delay=True
+)
+_file_handler.setLevel(logging.WARNING)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('multiple_inputs_graph/langgraph_agent.log')
-    ]
+    handlers=[_console_handler, _file_handler]
 )
 
 logger = logging.getLogger(__name__)
 
+# Directory graph images are written to: the one holding this module
+_OUT_DIR = Path(__file__).resolve().parent
+
+# Runs the graph image render off the main thread, see main()
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-image")
+
+# Seconds main() waits for the image once the user inputs are in
+_IMAGE_TIMEOUT = 5
+
+# int64 limits; parsed values at these bounds may have been clamped
+_I64_MAX = 2**63 - 1
+_I64_MIN = -2**63
+
 
 class AgentState(TypedDict):
     """
@@ -35,17 +67,31 @@ class AgentState(TypedDict):
     processing pipeline, containing user inputs and computation results.
     
     Attributes:
-        values (List[int]): List of integers to perform operations on
+        values (np.ndarray): Contiguous int64 array of the integers to perform
+            operations on (a plain list only if a value does not fit in int64)
         name (str): User's name for personalized responses
         operation (str): Mathematical operation to perform ('add' or 'multiply')
         result (str): Final formatted result message
     """
-    values: List[int]
+    values: Sequence[int]
     name: str
     operation: str
     result: str
 
 
+# Supported operations: result template and log label, keyed by operation name.
+# Templates take (name, result) and are filled with the % operator.
+_OPS: Dict[str, tuple] = {
+    "add": ("Hello %s, the sum is %s.", "Addition"),
+    "multiply": ("Hello %s, the product is %s.", "Multiplication"),
+}
+
+# Result templates for an unsupported operation (name, operation) and for a
+# failed calculation (name)
+_UNSUPPORTED_TMPL = "Hello %s, Are you stupid?, Unsupported operation idiot...'%s'. Use 'add' or 'multiply'."
+_ERROR_TMPL = "Hello %s, an error occurred during calculation."
+
+
 def operation_node(state: AgentState) -> AgentState:
     """
     Processes mathematical operations on the provided list of integers.
@@ -65,7 +111,7 @@ def operation_node(state: AgentState) -> AgentState:
         
     Example:
         >>> state = {
-        ...     "values": [2, 3, 4],
+        ...     "values": np.array([2, 3, 4], dtype=np.int64),
         ...     "name": "Alice",
         ...     "operation": "add",
         ...     "result": ""
@@ -74,39 +120,37 @@ def operation_node(state: AgentState) -> AgentState:
         >>> result["result"]
         "Hello Alice, the sum is 9."
     """
-    logger.info(f"Processing operation node for user: {state['name']}")
-    logger.debug(f"Values: {state['values']}, Operation: {state['operation']}")
+    logger.info("Processing operation node for user: %s", state['name'])
+    logger.debug("Values: %s, Operation: %s", state['values'], state['operation'])
+    
+    from multiple_inputs_graph._kernels import reduce_values
     
     try:
-        if state['operation'].lower() == 'add':
-            # Calculate sum of all values
-            total = sum(state['values'])
-            state['result'] = f"Hello {state['name']}, the sum is {total}."
-            logger.info(f"Addition completed: {total}")
-            
-        elif state['operation'].lower() == 'multiply':
-            # Calculate product of all values
-            product = 1
-            for value in state['values']:
-                product *= value
-            state['result'] = f"Hello {state['name']}, the product is {product}."
-            logger.info(f"Multiplication completed: {product}")
+        op = state['operation'].lower()
+        spec = _OPS.get(op)
+        
+        if spec is not None:
+            # Calculate the sum or product of all values
+            template, log_label = spec
+            total = reduce_values(state['values'], op)
+            state['result'] = template % (state['name'], total)
+            logger.info("%s completed: %s", log_label, total)
             
         else:
             # Handle unsupported operations
-            error_msg = f"Are you stupid?, Unsupported operation idiot...'{state['operation']}'. Use 'add' or 'multiply'."
-            state['result'] = f"Hello {state['name']}, {error_msg}"
-            logger.warning(f"Invalid operation attempted: {state['operation']}")
+            state['result'] = _UNSUPPORTED_TMPL % (state['name'], state['operation'])
+            logger.warning("Invalid operation attempted: %s", state['operation'])
     
     except Exception as e:
-        logger.error(f"Error in operation_node: {str(e)}")
-        state['result'] = f"Hello {state['name']}, an error occurred during calculation."
+        logger.error("Error in operation_node: %s", e)
+        state['result'] = _ERROR_TMPL % state['name']
     
-    logger.debug(f"Operation result: {state['result']}")
+    logger.debug("Operation result: %s", state['result'])
     return state
 
 
-def create_agent_graph() -> StateGraph:
+@functools.lru_cache(maxsize=1)
+def create_agent_graph() -> "StateGraph":
     """
     Creates and configures the LangGraph state graph for mathematical operations.
     
@@ -121,10 +165,18 @@ def create_agent_graph() -> StateGraph:
         
     Graph Structure:
         START → operation_node → END
+        
+    Note:
+        The graph is built once and the same StateGraph instance is returned
+        on every call. Do not add nodes or edges to it; build a new
+        StateGraph instead of mutating the shared one.
     """
     logger.info("Creating mathematical operations agent graph")
     
     try:
+        # Imported here so loading this module doesn't pull in langgraph
+        from langgraph.graph import StateGraph
+        
         # Initialize the state graph with AgentState type
         graph = StateGraph(AgentState)
         logger.debug("StateGraph initialized successfully")
@@ -142,56 +194,58 @@ def create_agent_graph() -> StateGraph:
         return graph
         
     except Exception as e:
-        logger.error(f"Failed to create agent graph: {str(e)}")
+        logger.error("Failed to create agent graph: %s", e)
         raise
 
 
-def save_graph_image(app, filename: str = "graph_visualization.png") -> str:
+@functools.lru_cache(maxsize=1)
+def get_compiled_app():
+    """
+    Returns the compiled mathematical operations graph, building it on first use.
+    
+    The graph definition is fixed by this module, so compiling it once per
+    process and sharing the result lets repeated runs skip graph
+    construction and validation.
+    
+    Returns:
+        The compiled LangGraph application
+    """
+    app = create_agent_graph().compile()
+    logger.info("Agent graph compiled successfully")
+    return app
+
+
+def save_graph_image(app, filename: str = "graph_visualization.png") -> Optional[str]:
     """
     Saves the graph visualization to a file in the multiple_inputs_graph directory.
     
-    This function generates a Mermaid diagram representation of the graph
-    structure and saves it as a PNG image for visualization purposes.
+    Delegates to the shared common.viz.save_graph_image, which reuses the
+    rendered PNG for an unchanged graph within the process and across runs.
     
     Args:
         app: The compiled graph to visualize
         filename (str): Name of the file to save the image to
         
     Returns:
-        str: Full path to the saved image file
+        Optional[str]: Full path to the saved image file, or None if
+        rendering was skipped (LG_SKIP_GRAPH_IMAGE=1)
         
     Raises:
         Exception: If image generation or saving fails
-        
-    File Location:
-        Saves to: ./multiple_inputs_graph/graph_visualization.png
     """
-    logger.info("Generating and saving graph visualization")
+    from common import viz
     
-    try:
-        # Create the multiple_inputs_graph directory if it doesn't exist
-        output_dir = os.path.join(os.getcwd(), "multiple_inputs_graph")
-        os.makedirs(output_dir, exist_ok=True)
-        logger.debug(f"Output directory ensured: {output_dir}")
-        
-        # Generate the Mermaid diagram as PNG bytes
-        mermaid_png = app.get_graph().draw_mermaid_png()
-        logger.debug("Mermaid diagram generated successfully")
-        
-        # Save to file in the multiple_inputs_graph directory
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, "wb") as f:
-            f.write(mermaid_png)
-        
-        logger.info(f"Graph visualization saved to: {filepath}")
-        return filepath
-        
-    except Exception as e:
-        logger.error(f"Failed to save graph visualization: {str(e)}")
-        raise
+    return viz.save_graph_image(app, _OUT_DIR, filename)
 
 
-def run_agent(app, inputsList: List[int], name: str, operation: str) -> Dict[str, Any]:
+def _values_list(values) -> List[int]:
+    """
+    Returns the values as a list of Python ints, converting NumPy arrays.
+    """
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def run_agent(app, inputsList: Union["np.ndarray", List[int]], name: str, operation: str) -> Dict[str, Any]:
     """
     Executes the mathematical operations agent with provided inputs.
     
@@ -200,12 +254,14 @@ def run_agent(app, inputsList: List[int], name: str, operation: str) -> Dict[str
     
     Args:
         app: The compiled LangGraph application
-        inputsList (List[int]): List of integers for mathematical operations
+        inputsList (Union[np.ndarray, List[int]]): Integers for mathematical
+            operations; lists are converted to an int64 array
         name (str): User's name for personalized responses
         operation (str): Mathematical operation to perform ('add' or 'multiply')
         
     Returns:
-        Dict[str, Any]: Agent state containing the computation result
+        Dict[str, Any]: Agent state containing the computation result, with
+        the values as a list of Python ints
         
     Raises:
         Exception: If agent execution fails
@@ -216,10 +272,20 @@ def run_agent(app, inputsList: List[int], name: str, operation: str) -> Dict[str
         >>> result["result"]
         "Hello Alice, the sum is 6."
     """
-    logger.info(f"Running agent for user: {name}")
-    logger.debug(f"Input parameters - Values: {inputsList}, Operation: {operation}")
+    import numpy as np
+    
+    logger.info("Running agent for user: %s", name)
+    logger.debug("Input parameters - Values: %s, Operation: %s", inputsList, operation)
     
     try:
+        # Store the values as one contiguous int64 buffer; a list holding
+        # values beyond int64 stays a list of Python ints
+        if not isinstance(inputsList, np.ndarray):
+            try:
+                inputsList = np.ascontiguousarray(inputsList, dtype=np.int64)
+            except OverflowError:
+                pass
+        
         # Prepare the initial state with user inputs
         initial_state = {
             "values": inputsList, 
@@ -227,26 +293,153 @@ def run_agent(app, inputsList: List[int], name: str, operation: str) -> Dict[str
             "operation": operation,
             "result": ""
         }
-        logger.debug(f"Initial state prepared: {initial_state}")
+        logger.debug("Initial state prepared: %s", initial_state)
         
-        # Execute the agent
+        # Execute the agent; the values are returned as a list of Python
+        # ints, whichever form the graph stored them in
         result = app.invoke(initial_state)
-        logger.info(f"Agent execution completed successfully")
-        logger.info(f"Final result: {result['result']}")
+        result["values"] = _values_list(result["values"])
+        logger.info("Agent execution completed successfully")
+        logger.info("Final result: %s", result['result'])
         
         return result
         
     except Exception as e:
-        logger.error(f"Error running agent: {str(e)}")
+        logger.error("Error running agent: %s", e)
         # Return error state instead of raising
         return {
-            "values": inputsList,
+            "values": _values_list(inputsList),
             "name": name,
             "operation": operation,
             "result": f"Hello {name}, an error occurred: {str(e)}"
         }
 
 
+def run_agent_batch(app, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Executes the mathematical operations agent for many requests at once.
+    
+    The values of all requests are concatenated into one buffer and each
+    operation is applied to every segment in a single vectorized pass, with
+    np.add.reduceat for sums and np.multiply.reduceat for products. Requests
+    the vectorized pass cannot compute exactly (empty values, unsupported
+    operations) go through run_agent and the graph instead.
+    
+    Args:
+        app: The compiled LangGraph application, used for fallback requests
+        batch (List[Dict[str, Any]]): Requests with the same keys run_agent
+            takes: "inputsList", "name" and "operation"
+        
+    Returns:
+        List[Dict[str, Any]]: One state per request, in the order given, with
+        the same fields run_agent returns
+        
+    Note:
+        Sums use int64 and are exact; a segment whose sum could overflow is
+        recomputed with Python integers. Products are reduced over Python
+        integers (object dtype) so they never overflow.
+        
+    Example:
+        >>> results = run_agent_batch(app, [
+        ...     {"inputsList": [1, 2, 3], "name": "Alice", "operation": "add"},
+        ...     {"inputsList": [2, 5], "name": "Bob", "operation": "multiply"},
+        ... ])
+        >>> [r["result"] for r in results]
+        ['Hello Alice, the sum is 6.', 'Hello Bob, the product is 10.']
+    """
+    import numpy as np
+    
+    logger.info("Running agent batch for %d requests", len(batch))
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+    
+    # Group request indexes by operation so each reduceat sees a single op
+    groups: Dict[str, List[int]] = {op: [] for op in _OPS}
+    for i, request in enumerate(batch):
+        op = request["operation"].lower()
+        if op in groups and len(request["inputsList"]):
+            groups[op].append(i)
+        else:
+            results[i] = run_agent(app, **request)
+    
+    for op, indexes in groups.items():
+        if not indexes:
+            continue
+        template, _ = _OPS[op]
+        
+        # Concatenate the segments and record where each one starts
+        dtype = np.int64 if op == "add" else object
+        try:
+            segments = [np.asarray(batch[i]["inputsList"], dtype=dtype) for i in indexes]
+        except OverflowError:
+            dtype = object
+            segments = [np.asarray(batch[i]["inputsList"], dtype=dtype) for i in indexes]
+        lengths = np.fromiter((seg.size for seg in segments), dtype=np.int64, count=len(segments))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        flat = np.concatenate(segments)
+        
+        if op == "add":
+            totals = np.add.reduceat(flat, offsets).tolist()
+            if dtype is np.int64:
+                # A segment sum is exact while length * max|v| fits in int64
+                bounds = np.maximum(np.maximum.reduceat(flat, offsets).astype(object),
+                                    -np.minimum.reduceat(flat, offsets).astype(object))
+                for k in np.flatnonzero(bounds * lengths > _I64_MAX):
+                    totals[k] = sum(segments[k].tolist())
+        else:
+            totals = np.multiply.reduceat(flat, offsets).tolist()
+        
+        for i, total, segment in zip(indexes, totals, segments):
+            request = batch[i]
+            results[i] = {
+                "values": segment.tolist(),
+                "name": request["name"],
+                "operation": request["operation"],
+                "result": template % (request["name"], total),
+            }
+        logger.debug("Batch %s completed for %d requests", op, len(indexes))
+    
+    return results
+
+
+def _parse_values(values_input: str):
+    """
+    Parses a comma-separated string of integers into an int64 array.
+    
+    NumPy's C parser handles the common case in one call. Its warning about
+    unparsed trailing text is raised as an error, so malformed input (or
+    spacing it does not accept, like empty items) goes through the
+    item-by-item Python parser instead, as do values outside the int64 range.
+    
+    Args:
+        values_input (str): Raw user input, e.g. "1,2,3"
+        
+    Returns:
+        np.ndarray or List[int]: Parsed values; a list only when a value does
+        not fit in int64
+        
+    Raises:
+        ValueError: If an item is not an integer
+    """
+    import numpy as np
+    
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            arr = np.fromstring(values_input, sep=",", dtype=np.int64)
+        # Saturated values may have been clamped by the C parser
+        if not arr.size or (arr.max() < _I64_MAX and arr.min() > _I64_MIN):
+            return arr
+    except (DeprecationWarning, ValueError):
+        pass
+    
+    values = [int(x.strip()) for x in values_input.split(",") if x.strip()]
+    try:
+        return np.array(values, dtype=np.int64)
+    except OverflowError:
+        return values
+
+
 def get_user_inputs() -> Dict[str, Any]:
     """
     Collects and validates user inputs for the mathematical operations agent.
@@ -274,23 +467,23 @@ def get_user_inputs() -> Dict[str, Any]:
         Enter your name: Alice
         Enter an operation (add/multiply): add
         >>> inputs
-        {'values': [1, 2, 3], 'name': 'Alice', 'operation': 'add'}
+        {'inputsList': array([1, 2, 3]), 'name': 'Alice', 'operation': 'add'}
     """
     logger.info("Collecting user inputs")
     
     try:
         # Collect integer values
         values_input = input("Enter a list of integers (comma-separated): ").strip()
-        logger.debug(f"Raw values input: '{values_input}'")
+        logger.debug("Raw values input: '%s'", values_input)
         
         # Parse and validate integers
         try:
-            values = [int(x.strip()) for x in values_input.split(",") if x.strip()]
-            if not values:
+            values = _parse_values(values_input)
+            if not len(values):
                 raise ValueError("No valid integers provided")
-            logger.debug(f"Parsed values: {values}")
+            logger.debug("Parsed values: %s", values)
         except ValueError as e:
-            logger.error(f"Invalid integer input: {values_input}")
+            logger.error("Invalid integer input: %s", values_input)
             raise ValueError("Please enter valid integers separated by commas") from e
         
         # Collect user name
@@ -298,14 +491,14 @@ def get_user_inputs() -> Dict[str, Any]:
         if not name:
             logger.warning("Empty name provided, using default")
             name = "Guest"
-        logger.debug(f"User name: '{name}'")
+        logger.debug("User name: '%s'", name)
         
         # Collect operation
         operation = input("Enter an operation (add/multiply): ").strip().lower()
         if operation not in ['add', 'multiply']:
-            logger.warning(f"Invalid operation '{operation}', defaulting to 'add'")
+            logger.warning("Invalid operation '%s', defaulting to 'add'", operation)
             operation = 'add'
-        logger.debug(f"Operation: '{operation}'")
+        logger.debug("Operation: '%s'", operation)
         
         # Prepare inputs dictionary
         inputs = {
@@ -314,14 +507,14 @@ def get_user_inputs() -> Dict[str, Any]:
             "operation": operation
         }
         
-        logger.info(f"User inputs collected successfully: {len(values)} values, operation: {operation}")
+        logger.info("User inputs collected successfully: %s values, operation: %s", len(values), operation)
         return inputs
         
     except KeyboardInterrupt:
         logger.warning("User interrupted input collection")
         raise
     except ValueError as e:
-        logger.error(f"Invalid input provided: {str(e)}")
+        logger.error("Invalid input provided: %s", e)
         raise ValueError("Please enter valid inputs.") from e
 
 
@@ -331,7 +524,7 @@ def main() -> None:
     
     This function coordinates the following steps:
     1. Creates and compiles the agent graph
-    2. Saves the graph visualization
+    2. Saves the graph visualization (in a background thread)
     3. Collects user inputs
     4. Executes the agent with user inputs
     5. Displays the results
@@ -349,32 +542,41 @@ def main() -> None:
     try:
         # Step 1: Create and compile the agent graph
         logger.info("Step 1: Creating agent graph")
-        graph = create_agent_graph()
-        app = graph.compile()
-        logger.info("Agent graph compiled successfully")
+        app = get_compiled_app()
         
-        # Step 2: Save graph visualization
+        # Step 2: Save graph visualization in the background; the render
+        # waits on network I/O and overlaps with the user typing their inputs
         logger.info("Step 2: Saving graph visualization")
-        image_path = save_graph_image(app)
-        logger.info(f"Graph visualization available at: {image_path}")
+        image_future = _EXECUTOR.submit(save_graph_image, app)
         
         # Step 3: Collect user inputs
         logger.info("Step 3: Collecting user inputs")
         user_inputs = get_user_inputs()
         
+        # A failed or slow render must not stop the run
+        try:
+            image_path = image_future.result(timeout=_IMAGE_TIMEOUT)
+            if image_path:
+                logger.info("Graph visualization available at: %s", image_path)
+        except FutureTimeoutError:
+            logger.warning("Graph visualization not ready after %ss, continuing", _IMAGE_TIMEOUT)
+        except Exception as e:
+            logger.warning("Graph visualization failed, continuing: %s", e)
+        
         # Step 4: Execute the agent
         logger.info("Step 4: Executing agent")
         result = run_agent(app, **user_inputs)
         
-        # Step 5: Display results
-        logger.info("="*60)
-        logger.info("AGENT EXECUTION SUMMARY")
-        logger.info("="*60)
-        logger.info(f"User: {user_inputs['name']}")
-        logger.info(f"Values: {user_inputs['inputsList']}")
-        logger.info(f"Operation: {user_inputs['operation']}")
-        logger.info(f"Result: {result['result']}")
-        logger.info("="*60)
+        # Step 5: Display results (skipped entirely when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("="*60)
+            logger.info("AGENT EXECUTION SUMMARY")
+            logger.info("="*60)
+            logger.info("User: %s", user_inputs['name'])
+            logger.info("Values: %s", user_inputs['inputsList'])
+            logger.info("Operation: %s", user_inputs['operation'])
+            logger.info("Result: %s", result['result'])
+            logger.info("="*60)
         
         logger.info("Mathematical operations agent completed successfully")
         
@@ -383,7 +585,7 @@ def main() -> None:
         print("\nApplication interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.critical(f"Application failed with error: {str(e)}")
+        logger.critical("Application failed with error: %s", e)
         print(f"An error occurred: {str(e)}")
         sys.exit(1)
 
@@ -0,0 +1,6 @@
+"""
+LangGraph sequential graph example.
+
+Run from the repository root with: python -m sequential_graph.main
+
+"""
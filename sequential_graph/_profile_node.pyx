@@ -0,0 +1,36 @@
+# cython: language_level=3
+"""
+Cython build of the sequential graph's profile string builder.
+
+This module is an optional drop-in for the pure-Python build_profile in
+main.py. When many profiles run through app.batch, the string assembly in
+profile_node is the only work the graph does per user, and compiling it
+removes the interpreter overhead around the f-string and join.
+
+Build it in place (from the repository root) with:
+
+    pip install cython
+    cythonize -i sequential_graph/_profile_node.pyx
+
+The extension module lands next to this file, where main.py picks it up on
+import; without it main.py falls back to the Python implementation.
+
+"""
+
+
+cpdef str build_profile(str name, object age, str skills_block):
+    """
+    Builds the complete profile message for one user.
+
+    Args:
+        name (str): User's name for personalized responses
+        age (int): User's age in years; kept a Python object rather than a
+            C integer, so any int is accepted, as in the pure-Python build
+        skills_block (str): Pre-formatted skills section from
+            format_skills_block
+
+    Returns:
+        str: The profile message
+    """
+    cdef list parts = [f"Hello {name}, you are {age} years old.", skills_block]
+    return "".join(parts)
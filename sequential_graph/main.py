@@ -1,56 +1,170 @@
 """
 LangGraph Sequential Graph Agent Implementation
 
-This module demonstrates a LangGraph agent that uses several nodes connected
-through edges to create a sequential processing workflow. The agent processes
-user information (name, age, skills) through a pipeline of connected nodes.
+This module demonstrates a LangGraph agent that processes user information
+(name, age, skills) through a sequential pipeline. The name, age and skills
+steps are implemented as separate nodes; the graph runs them fused into a
+single profile node so the state makes one trip through the executor.
 
 """
 
+import argparse
+import asyncio
+import atexit
+import contextlib
+import functools
 import logging
+import logging.handlers
 import os
-from typing import TypedDict, Dict, List, Any
+import queue
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, List, Any
 from langgraph.graph import StateGraph
-from IPython.display import Image, display
+from langgraph.checkpoint.sqlite import SqliteSaver
 import sys
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('sequential_graph/langgraph_agent.log')
-    ]
-)
+from common import viz
 
 logger = logging.getLogger(__name__)
+# Library imports stay silent; handlers are attached by main() only
+logger.addHandler(logging.NullHandler())
 
 
-class AgentState(TypedDict):
+def _configure_logging() -> None:
+    """
+    Configures console and file logging for command-line runs.
+    
+    Called from main() so importing this module neither opens the log file
+    nor touches the root logger. Console output stays synchronous; file
+    records are enqueued and written by a background listener, keeping disk
+    I/O off the request path. The listener buffers records in a
+    MemoryHandler, so the file (opened on the first flush) is written in
+    batches: when 1024 records are pending, when an ERROR is logged, and
+    at exit.
+    """
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=logging.FileHandler('sequential_graph/langgraph_agent.log', delay=True)
+    )
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, memory_handler)
+    listener.start()
+    # atexit runs in reverse order: drain the queue first, then flush
+    atexit.register(memory_handler.flush)
+    atexit.register(listener.stop)
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.handlers.QueueHandler(log_queue)
+        ]
+    )
+
+
+# Runs the graph image render off the main thread, see main()
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graph-image")
+
+# Seconds main() waits for the image once the user inputs are in
+_IMAGE_TIMEOUT = 5
+
+# Separator between skills in a comma-separated list, with the spaces around
+# it, so splitting also strips the items
+_SKILLS_RE = re.compile(r"\s*,\s*")
+
+# Directory graph images are written to: the one holding this module
+_OUT_DIR = Path(__file__).resolve().parent
+
+# SQLite database holding the checkpoints of agent runs
+_CHECKPOINT_DB = 'sequential_graph/agent_state.db'
+
+
+@dataclass(slots=True)
+class AgentState:
     """
     State structure for the sequential graph agent.
     
-    This TypedDict defines the data structure that flows through the agent's
-    sequential processing pipeline, containing user information and results.
+    This slotted dataclass defines the data structure that flows through the
+    agent's sequential processing pipeline, containing user information and
+    results. Nodes read and update fields as attributes, which on a __slots__
+    class is a fixed-offset lookup rather than a dict hash probe.
     
     Attributes:
         skills (List[str]): List of user's skills/abilities
         name (str): User's name for personalized responses
         age (int): User's age in years
-        result (str): Accumulated result message built through the pipeline
+        skills_block (str): Pre-formatted skills section of the result,
+            built once from skills by format_skills_block
+        result (str): Final result message built through the pipeline
     """
     skills: List[str]
     name: str
     age: int
-    result: str
+    skills_block: str = ""
+    result: str = ""
+
+
+def format_skills_block(skills: List[str]) -> str:
+    """
+    Formats the skills section of the profile message.
+    
+    The skills do not change while a user's state moves through the graph,
+    so this is computed once when the inputs are collected and stored in
+    the state, rather than re-joined by the node on every run.
+    
+    Args:
+        skills (List[str]): List of user's skills/abilities
+        
+    Returns:
+        str: The skills as a bulleted list, or a note that there are none
+        
+    Example:
+        >>> format_skills_block(["Python", "AI"])
+        '\\nYour skills include:\\n\\t- Python\\n\\t- AI'
+    """
+    if skills:
+        return "\nYour skills include:\n\t- " + "\n\t- ".join(skills)
+    return "\nYou have no specified skills."
+
+
+def _build_profile(name: str, age: int, skills_block: str) -> str:
+    """
+    Builds the complete profile message for one user.
+    
+    Pure-Python implementation of build_profile, used when the Cython
+    extension built from _profile_node.pyx is not available.
+    
+    Args:
+        name (str): User's name for personalized responses
+        age (int): User's age in years
+        skills_block (str): Pre-formatted skills section from
+            format_skills_block
+        
+    Returns:
+        str: The profile message
+    """
+    parts = [f"Hello {name}, you are {age} years old.", skills_block]
+    return "".join(parts)
+
+
+try:
+    # Compiled build (cythonize -i sequential_graph/_profile_node.pyx)
+    from sequential_graph._profile_node import build_profile
+except ImportError:
+    build_profile = _build_profile
 
 
 def name_node(state: AgentState) -> AgentState:
     """
     First node in the pipeline that processes the user's name.
     
-    This node initiates the result message with a personalized greeting
+    This node starts the result message with a personalized greeting
     using the user's name. It serves as the entry point for the sequential
     processing workflow.
     
@@ -58,31 +172,19 @@ def name_node(state: AgentState) -> AgentState:
         state (AgentState): Current state containing user information
         
     Returns:
-        AgentState: Updated state with initial greeting message
+        AgentState: Updated state with the greeting as the result so far
         
     Processing:
         - Creates initial greeting with user's name
         - Starts building the result message
         
     Example:
-        >>> state = {"name": "Alice", "age": 25, "skills": ["Python"], "result": ""}
+        >>> state = AgentState(skills=["Python"], name="Alice", age=25)
         >>> result = name_node(state)
-        >>> result["result"]
-        "Hello Alice,"
+        >>> result.result
+        'Hello Alice,'
     """
-    logger.info(f"Processing name node for user: {state['name']}")
-    logger.debug(f"Name: {state['name']}, Age: {state['age']}, Skills: {state['skills']}")
-
-    try:
-        # Initialize the result message with personalized greeting
-        state['result'] = f"Hello {state['name']},"
-        logger.info(f"Name processing completed: greeting initialized")
-    
-    except Exception as e:
-        logger.error(f"Error in name_node: {str(e)}")
-        state['result'] = f"Hello {state.get('name', 'Guest')}, an error occurred during name processing."
-    
-    logger.debug(f"Name node result: {state['result']}")
+    state.result = f"Hello {state.name},"
     return state
 
 
@@ -90,38 +192,27 @@ def age_node(state: AgentState) -> AgentState:
     """
     Second node in the pipeline that processes the user's age.
     
-    This node appends age information to the existing result message,
-    building upon the greeting created by the name node.
+    This node appends age information to the result message, building upon
+    the greeting created by the name node.
     
     Args:
-        state (AgentState): Current state with existing result from name node
+        state (AgentState): Current state with the greeting from name node
         
     Returns:
-        AgentState: Updated state with age information added to result
+        AgentState: Updated state with age information added to the result
         
     Processing:
-        - Appends age information to existing result message
+        - Builds the age fragment and appends it to the result
         - Maintains the sequential flow of information
         
     Example:
-        >>> state = {"name": "Alice", "age": 25, "skills": ["Python"], "result": "Hello Alice,"}
+        >>> state = AgentState(skills=["Python"], name="Alice", age=25, result="Hello Alice,")
         >>> result = age_node(state)
-        >>> result["result"]
-        "Hello Alice, you are 25 years old."
+        >>> result.result
+        'Hello Alice, you are 25 years old.'
     """
-    logger.info(f"Processing age node for user: {state['name']}")
-    logger.debug(f"Name: {state['name']}, Age: {state['age']}, Skills: {state['skills']}")
-    
-    try:
-        # Append age information to existing result
-        state["result"] += f" you are {state['age']} years old."
-        logger.info(f"Age processing completed: age {state['age']} added to result")
-    
-    except Exception as e:
-        logger.error(f"Error in age_node: {str(e)}")
-        state['result'] = f"Hello {state.get('name', 'Guest')}, an error occurred during age processing."
-    
-    logger.debug(f"Age node result: {state['result']}")
+    fragment = f" you are {state.age} years old."
+    state.result += fragment
     return state
 
 
@@ -133,46 +224,65 @@ def skills_node(state: AgentState) -> AgentState:
     information, creating a comprehensive profile summary.
     
     Args:
-        state (AgentState): Current state with existing result from previous nodes
+        state (AgentState): Current state with the result from previous nodes
         
     Returns:
         AgentState: Updated state with complete profile information
         
     Processing:
-        - Formats and appends skills list to the result message
-        - Handles empty skills list gracefully
-        - Completes the sequential processing workflow
+        - Appends the pre-formatted skills block to the result, completing
+          the sequential processing workflow
         
     Example:
-        >>> state = {
-        ...     "name": "Alice", 
-        ...     "age": 25, 
-        ...     "skills": ["Python", "JavaScript"], 
-        ...     "result": "Hello Alice, you are 25 years old."
-        ... }
+        >>> state = AgentState(
+        ...     skills=["Python", "JavaScript"],
+        ...     name="Alice",
+        ...     age=25,
+        ...     skills_block=format_skills_block(["Python", "JavaScript"]),
+        ...     result="Hello Alice, you are 25 years old."
+        ... )
         >>> result = skills_node(state)
-        >>> "Python" in result["result"] and "JavaScript" in result["result"]
+        >>> "Python" in result.result and "JavaScript" in result.result
         True
     """
-    logger.info(f"Processing skills node for user: {state['name']}")
-    logger.debug(f"Name: {state['name']}, Age: {state['age']}, Skills: {state['skills']}")
-    
-    try:
-        if state['skills']:
-            # Format skills as a bulleted list
-            skills_list = '\n\t- '.join(state['skills'])
-            state["result"] += f"\nYour skills include:\n\t- {skills_list}"
-            logger.info(f"Skills processing completed: {len(state['skills'])} skills added")
-        else:
-            # Handle empty skills list
-            state["result"] += "\nYou have no specified skills."
-            logger.info("Skills processing completed: no skills specified")
+    state.result += state.skills_block
+    return state
+
+
+def profile_node(state: AgentState) -> AgentState:
+    """
+    Single fused node that builds the complete profile in one step.
     
-    except Exception as e:
-        logger.error(f"Error in skills_node: {str(e)}")
-        state['result'] = f"Hello {state.get('name', 'Guest')}, an error occurred during skills processing."
+    This node produces the same result as running name_node, age_node and
+    skills_node in sequence, but as one graph step, so the state passes
+    through the graph executor once instead of three times. The message is
+    assembled by build_profile, compiled with Cython when the extension is
+    built. It is the node wired into the graph by create_agent_graph; the
+    three step nodes remain available for use and testing on their own.
     
-    logger.debug(f"Skills node result: {state['result']}")
+    Args:
+        state (AgentState): Current state containing user information
+        
+    Returns:
+        AgentState: Updated state with complete profile information
+        
+    Processing:
+        - Creates the greeting with the user's name
+        - Adds the age information
+        - Appends the pre-formatted skills block
+        
+    Example:
+        >>> skills = ["Python", "AI"]
+        >>> state = AgentState(skills=skills, name="Alice", age=25,
+        ...                    skills_block=format_skills_block(skills))
+        >>> result = profile_node(state)
+        >>> print(result.result)
+        Hello Alice, you are 25 years old.
+        Your skills include:
+        	- Python
+        	- AI
+    """
+    state.result = build_profile(state.name, state.age, state.skills_block)
     return state
 
 
@@ -180,8 +290,8 @@ def create_agent_graph() -> StateGraph:
     """
     Creates and configures the LangGraph state graph for sequential processing.
     
-    This function builds a sequential graph with three connected nodes:
-    name → age → skills, creating a pipeline for processing user information.
+    This function builds the profile graph around the fused profile_node,
+    which performs the name → age → skills pipeline in a single graph step.
     
     Returns:
         StateGraph: Configured graph ready for compilation
@@ -190,9 +300,11 @@ def create_agent_graph() -> StateGraph:
         Exception: If graph creation fails
         
     Graph Structure:
-        START → name_node → age_node → skills_node → END
+        START → profile_node → END
         
     Node Flow:
+        profile_node performs, in one step, what the standalone step nodes
+        do in sequence:
         1. name_node: Processes user's name, creates initial greeting
         2. age_node: Adds age information to the result
         3. skills_node: Completes with skills information
@@ -204,86 +316,247 @@ def create_agent_graph() -> StateGraph:
         graph = StateGraph(AgentState)
         logger.debug("StateGraph initialized successfully")
         
-        # Add processing nodes to the graph
-        graph.add_node("name", name_node)
-        logger.debug("Name node added to graph")
-        graph.add_node("age", age_node)
-        logger.debug("Age node added to graph")
-        graph.add_node("skills", skills_node)
-        logger.debug("Skills node added to graph")
-        
-        # Configure sequential graph flow
-        graph.set_entry_point("name")
-        graph.add_edge("name", "age")
-        graph.add_edge("age", "skills")
-        graph.set_finish_point("skills")
-        logger.debug("Sequential graph flow configured: name → age → skills")
+        # Add the fused profile node (name → age → skills in one step)
+        graph.add_node("profile", profile_node)
+        logger.debug("Profile node added to graph")
+        
+        # Configure graph flow: direct entry and exit through the profile node
+        graph.set_entry_point("profile")
+        graph.set_finish_point("profile")
+        logger.debug("Graph flow configured: profile (name → age → skills)")
         
         logger.info("Sequential agent graph created successfully")
         return graph
         
     except Exception as e:
-        logger.error(f"Failed to create agent graph: {str(e)}")
+        logger.error("Failed to create agent graph: %s", e)
         raise
 
 
-def save_graph_image(app, filename: str = "graph_visualization.png") -> str:
+def _get_checkpointer() -> SqliteSaver:
+    """
+    Opens the SQLite checkpointer that persists agent runs.
+    
+    The connection is shared with LangGraph's worker threads, so it is
+    opened with check_same_thread=False, and it is closed at exit.
+    
+    Returns:
+        SqliteSaver: Checkpointer backed by sequential_graph/agent_state.db
+    """
+    conn = sqlite3.connect(_CHECKPOINT_DB, check_same_thread=False)
+    atexit.register(conn.close)
+    logger.debug("Checkpoint database opened: %s", _CHECKPOINT_DB)
+    return SqliteSaver(conn)
+
+
+@functools.lru_cache(maxsize=1)
+def get_compiled_app():
+    """
+    Returns the compiled sequential agent graph, building it on first use.
+    
+    The graph definition is fixed by this module, so compiling it once per
+    process and sharing the result lets repeated runs skip graph
+    construction and validation. This graph has no checkpointer; use
+    get_checkpointed_app for runs that should be saved under a thread_id.
+    
+    Returns:
+        The compiled LangGraph application
+    """
+    app = create_agent_graph().compile()
+    logger.info("Sequential agent graph compiled successfully")
+    return app
+
+
+@functools.lru_cache(maxsize=1)
+def get_checkpointed_app():
+    """
+    Returns the sequential agent graph compiled with the SQLite checkpointer.
+    
+    Runs given a thread_id are recorded in sequential_graph/agent_state.db
+    under that id, where their checkpoints can be inspected later. The graph
+    has a single node, so a later run on the same id replaces the saved
+    state rather than building on it.
+    
+    Returns:
+        The compiled LangGraph application
+    """
+    app = create_agent_graph().compile(checkpointer=_get_checkpointer())
+    logger.info("Checkpointed sequential agent graph compiled successfully")
+    return app
+
+
+@contextlib.asynccontextmanager
+async def async_checkpointed_app():
+    """
+    Yields the sequential agent graph compiled with an async SQLite checkpointer.
+    
+    SqliteSaver only implements the synchronous checkpointer methods, so
+    ainvoke runs that use a thread_id need AsyncSqliteSaver instead. Its
+    connection belongs to the running event loop and is closed when the
+    context exits.
+    
+    Yields:
+        The compiled LangGraph application
+        
+    Example:
+        >>> async with async_checkpointed_app() as app:
+        ...     result = await run_agent_async(app, ["Python"], "Alice", 25, thread_id="alice")
+    """
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    
+    async with AsyncSqliteSaver.from_conn_string(_CHECKPOINT_DB) as checkpointer:
+        logger.debug("Async checkpoint database opened: %s", _CHECKPOINT_DB)
+        yield create_agent_graph().compile(checkpointer=checkpointer)
+
+
+def save_graph_image(app, filename: str = "graph_visualization.png") -> Optional[str]:
     """
     Saves the graph visualization to a file in the sequential_graph directory.
     
-    This function generates a Mermaid diagram representation of the sequential
-    graph structure and saves it as a PNG image for visualization purposes.
+    Delegates to the shared common.viz.save_graph_image, which reuses the
+    rendered PNG for an unchanged graph within the process and across runs.
     
     Args:
         app: The compiled graph to visualize
         filename (str): Name of the file to save the image to
         
     Returns:
-        str: Full path to the saved image file
+        Optional[str]: Full path to the saved image file, or None if
+        rendering was skipped (LG_SKIP_GRAPH_IMAGE=1)
         
     Raises:
         Exception: If image generation or saving fails
-        
-    File Location:
-        Saves to: ./sequential_graph/graph_visualization.png
     """
-    logger.info("Generating and saving graph visualization")
+    return viz.save_graph_image(app, _OUT_DIR, filename)
+
+
+def _initial_state(skills: List[str], name: str, age: int,
+                   skills_block: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Builds the graph input for one user, formatting the skills block if the
+    caller did not precompute it.
+    """
+    if skills_block is None:
+        skills_block = format_skills_block(skills)
+    return {
+        "skills": skills,
+        "name": name,
+        "age": age,
+        "skills_block": skills_block,
+        "result": ""
+    }
+
+
+def _error_state(error: Exception, skills: List[str], name: str, age: int) -> Dict[str, Any]:
+    """
+    Builds the state returned for a user whose run failed.
+    """
+    return {
+        "skills": skills,
+        "name": name,
+        "age": age,
+        "result": f"Hello {name}, an error occurred during processing: {str(error)}"
+    }
+
+
+def _thread_config(thread_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Builds the run config selecting a checkpoint thread.
     
-    try:
-        # Create the sequential_graph directory if it doesn't exist
-        output_dir = os.path.join(os.getcwd(), "sequential_graph")
-        os.makedirs(output_dir, exist_ok=True)
-        logger.debug(f"Output directory ensured: {output_dir}")
-        
-        # Generate the Mermaid diagram as PNG bytes
-        mermaid_png = app.get_graph().draw_mermaid_png()
-        logger.debug("Mermaid diagram generated successfully")
+    Args:
+        thread_id (Optional[str]): Checkpoint thread to run on
         
-        # Save to file in the sequential_graph directory
-        filepath = os.path.join(output_dir, filename)
-        with open(filepath, "wb") as f:
-            f.write(mermaid_png)
+    Returns:
+        Dict[str, Any]: Config for invoke/batch; empty when no thread_id is
+        given, so runs without one leave no checkpoint behind
+    """
+    return {"configurable": {"thread_id": thread_id}} if thread_id else {}
+
+
+def run_agent_batch(app, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Executes the sequential graph agent for several users in one call.
+    
+    All initial states are passed to the compiled graph's batch() method,
+    which runs them concurrently and shares the executor setup across
+    inputs. This is the preferred entry point for scripted workloads that
+    profile many users; run_agent is a single-user wrapper around it.
+    Users with no skills and no thread_id skip the graph: their profile
+    depends only on name and age and is built directly.
+    
+    Args:
+        app: The compiled LangGraph application
+        users (List[Dict[str, Any]]): One dict per user with the arguments
+            run_agent takes: "skills", "name", "age" and optionally
+            "skills_block" and "thread_id"
         
-        logger.info(f"Graph visualization saved to: {filepath}")
-        return filepath
+    Returns:
+        List[Dict[str, Any]]: One final state per user, in the order given.
+        A user whose run fails gets an error state instead of raising.
         
-    except Exception as e:
-        logger.error(f"Failed to save graph visualization: {str(e)}")
-        raise
+    Example:
+        >>> app = get_compiled_app()
+        >>> results = run_agent_batch(app, [
+        ...     {"skills": ["Python"], "name": "Alice", "age": 25},
+        ...     {"skills": [], "name": "Bob", "age": 30},
+        ... ])
+        >>> [r["name"] for r in results]
+        ['Alice', 'Bob']
+    """
+    logger.info("Running sequential agent batch for %s users", len(users))
+    
+    # Prepare the initial states with user inputs. A user without skills
+    # and without a thread to checkpoint gets a profile fully determined by
+    # name and age, so it is built directly instead of through the executor.
+    results: List[Optional[Dict[str, Any]]] = [None] * len(users)
+    pending = []
+    for i, user in enumerate(users):
+        state = _initial_state(user["skills"], user["name"], user["age"], user.get("skills_block"))
+        if not user["skills"] and user.get("thread_id") is None:
+            state["result"] = build_profile(user["name"], user["age"], state["skills_block"])
+            results[i] = state
+        else:
+            pending.append((i, state))
+    
+    if pending:
+        # Execute the remaining users through the sequential pipeline at
+        # once, each on its own thread
+        configs = [
+            {**_thread_config(users[i].get("thread_id")), "max_concurrency": os.cpu_count()}
+            for i, _ in pending
+        ]
+        outputs = app.batch([state for _, state in pending], config=configs, return_exceptions=True)
+        
+        for (i, _), output in zip(pending, outputs):
+            if isinstance(output, Exception):
+                user = users[i]
+                logger.error("Error running sequential agent for %s: %s", user['name'], output)
+                # Return error state instead of raising
+                output = _error_state(output, user["skills"], user["name"], user["age"])
+            results[i] = output
+    
+    logger.info("Sequential agent batch completed for %s users", len(results))
+    return results
 
 
-def run_agent(app, skills: List[str], name: str, age: int) -> Dict[str, Any]:
+def run_agent(app, skills: List[str], name: str, age: int,
+              skills_block: Optional[str] = None,
+              thread_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Executes the sequential graph agent with provided user information.
     
-    This function invokes the compiled graph with user inputs and processes
-    them through the sequential pipeline of nodes.
+    This function runs a single user through the sequential pipeline of
+    nodes via run_agent_batch.
     
     Args:
         app: The compiled LangGraph application
         skills (List[str]): List of user's skills/abilities
         name (str): User's name for personalized responses
         age (int): User's age in years
+        skills_block (Optional[str]): Skills section precomputed by
+            get_user_inputs; formatted from skills when omitted
+        thread_id (Optional[str]): Checkpoint thread the run is recorded
+            under. Needs an app compiled with a checkpointer
         
     Returns:
         Dict[str, Any]: Agent state containing the complete profile summary
@@ -293,44 +566,96 @@ def run_agent(app, skills: List[str], name: str, age: int) -> Dict[str, Any]:
         
     Processing Flow:
         1. Creates initial state with user inputs
-        2. Executes through name → age → skills pipeline
+        2. Executes the name → age → skills pipeline (fused profile node)
         3. Returns final state with complete profile
         
     Example:
-        >>> app = create_agent_graph().compile()
+        >>> app = get_compiled_app()
         >>> result = run_agent(app, ["Python", "AI"], "Alice", 25)
         >>> "Alice" in result["result"] and "25" in result["result"]
         True
     """
-    logger.info(f"Running sequential agent for user: {name}")
-    logger.debug(f"Input parameters - Skills: {skills}, Age: {age}")
+    logger.info("Running sequential agent for user: %s", name)
+    logger.debug("Input parameters - Skills: %s, Age: %s", skills, age)
     
-    try:
-        # Prepare the initial state with user inputs
-        initial_state = {
-            "skills": skills, 
-            "name": name, 
-            "age": age,
-            "result": ""
-        }
-        logger.debug(f"Initial state prepared: {initial_state}")
+    user = {"skills": skills, "name": name, "age": age,
+            "skills_block": skills_block, "thread_id": thread_id}
+    result = run_agent_batch(app, [user])[0]
+    logger.info("Final result length: %s characters", len(result['result']))
+    
+    return result
+
+
+async def run_agent_async(app, skills: List[str], name: str, age: int,
+                          skills_block: Optional[str] = None,
+                          thread_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Asynchronous counterpart of run_agent.
+    
+    Awaiting the graph lets many runs share one event loop, so when the
+    nodes wait on I/O (e.g. an LLM call) those waits overlap instead of
+    adding up. Runs with a thread_id need an app from
+    async_checkpointed_app, whose checkpointer supports ainvoke.
+    
+    Args:
+        app: The compiled LangGraph application
+        skills (List[str]): List of user's skills/abilities
+        name (str): User's name for personalized responses
+        age (int): User's age in years
+        skills_block (Optional[str]): Skills section precomputed by
+            get_user_inputs; formatted from skills when omitted
+        thread_id (Optional[str]): Checkpoint thread the run is recorded
+            under. Needs an app compiled with a checkpointer
         
-        # Execute the agent through sequential pipeline
-        result = app.invoke(initial_state)
-        logger.info(f"Sequential agent execution completed successfully")
-        logger.info(f"Final result length: {len(result['result'])} characters")
+    Returns:
+        Dict[str, Any]: Agent state containing the complete profile summary
         
-        return result
+    Raises:
+        Exception: If agent execution fails (caught and returned as error state)
+    """
+    logger.info("Running sequential agent asynchronously for user: %s", name)
+    
+    try:
+        return await app.ainvoke(
+            _initial_state(skills, name, age, skills_block),
+            _thread_config(thread_id)
+        )
         
     except Exception as e:
-        logger.error(f"Error running sequential agent: {str(e)}")
-        # Return error state instead of raising
-        return {
-            "skills": skills,
-            "name": name,
-            "age": age,
-            "result": f"Hello {name}, an error occurred during processing: {str(e)}"
-        }
+        logger.error("Error running sequential agent: %s", e)
+        return _error_state(e, skills, name, age)
+
+
+async def run_many(app, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Runs several users through the agent concurrently with asyncio.gather.
+    
+    Args:
+        app: The compiled LangGraph application
+        users (List[Dict[str, Any]]): One dict of run_agent arguments
+            ("skills", "name", "age", optionally "skills_block" and
+            "thread_id") per user
+        
+    Returns:
+        List[Dict[str, Any]]: Final states, in the same order as users
+        
+    Example:
+        >>> results = asyncio.run(run_many(app, [
+        ...     {"skills": ["Python"], "name": "Alice", "age": 25},
+        ...     {"skills": [], "name": "Bob", "age": 30},
+        ... ]))
+    """
+    return await asyncio.gather(*(run_agent_async(app, **user) for user in users))
+
+
+async def _run_async(user_inputs: Dict[str, Any], thread_id: Optional[str]) -> Dict[str, Any]:
+    """
+    Runs one user on an event loop for main(), checkpointed when thread_id is set.
+    """
+    if thread_id is None:
+        return (await run_many(get_compiled_app(), [user_inputs]))[0]
+    async with async_checkpointed_app() as app:
+        return await run_agent_async(app, **user_inputs, thread_id=thread_id)
 
 
 def get_user_inputs() -> Dict[str, Any]:
@@ -343,7 +668,8 @@ def get_user_inputs() -> Dict[str, Any]:
     3. Their age as an integer
     
     Returns:
-        Dict[str, Any]: Dictionary containing validated user inputs
+        Dict[str, Any]: Dictionary containing validated user inputs and the
+        pre-formatted skills block
         
     Raises:
         ValueError: If user provides invalid input format
@@ -365,81 +691,154 @@ def get_user_inputs() -> Dict[str, Any]:
         Enter your name: Alice
         Enter your age(int): 25
         >>> inputs
-        {'skills': ['Python', 'AI', 'Machine Learning'], 'name': 'Alice', 'age': 25}
+        {'skills': ['Python', 'AI', 'Machine Learning'], 'name': 'Alice', 'age': 25, 'skills_block': '...'}
     """
     logger.info("Collecting user inputs for sequential agent")
     
     try:
         # Collect skills as strings (not integers like in the original)
         skills_input = input("Enter your skills (comma-separated): ").strip()
-        logger.debug(f"Raw skills input: '{skills_input}'")
+        logger.debug("Raw skills input: '%s'", skills_input)
         
-        # Parse and validate skills as strings
-        try:
-            skills = [x.strip() for x in skills_input.split(",") if x.strip()]
-            # Skills can be empty, so no validation error needed
-            logger.debug(f"Parsed skills: {skills}")
-        except Exception as e:
-            logger.warning(f"Error parsing skills input: {e}")
-            skills = []  # Default to empty list
+        # Parse skills as strings (can be empty, so no validation error needed)
+        skills = [x for x in _SKILLS_RE.split(skills_input) if x]
+        logger.debug("Parsed skills: %s", skills)
         
         # Collect user name
         name = input("Enter your name: ").strip()
         if not name:
             logger.warning("Empty name provided, using default")
             name = "Guest"
-        logger.debug(f"User name: '{name}'")
+        logger.debug("User name: '%s'", name)
         
         # Collect and validate age
         age_input = input("Enter your age (integer): ").strip()
         try:
             age = int(age_input)
             if age < 0:
-                logger.warning(f"Negative age provided: {age}, using absolute value")
+                logger.warning("Negative age provided: %s, using absolute value", age)
                 age = abs(age)
         except ValueError:
-            logger.warning(f"Invalid age input '{age_input}', defaulting to 0")
+            logger.warning("Invalid age input '%s', defaulting to 0", age_input)
             age = 0
-        logger.debug(f"User age: {age}")
+        logger.debug("User age: %s", age)
         
-        # Prepare inputs dictionary
+        # Prepare inputs dictionary, formatting the skills block once here
+        # so the graph nodes only append it
         inputs = {
             "skills": skills,
             "name": name,
-            "age": age
+            "age": age,
+            "skills_block": format_skills_block(skills)
         }
 
-        logger.info(f"User inputs collected successfully: {len(skills)} skills, age: {age}")
+        logger.info("User inputs collected successfully: %s skills, age: %s", len(skills), age)
         return inputs
         
     except KeyboardInterrupt:
         logger.warning("User interrupted input collection")
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during input collection: {str(e)}")
+        logger.error("Unexpected error during input collection: %s", e)
         raise ValueError("Failed to collect user inputs") from e
 
 
+def _parse_args() -> argparse.Namespace:
+    """
+    Parses the command-line options for main().
+    
+    Rendering the graph image is opt-in: scripted and CI runs rarely look at
+    it, so it is only produced with --visualize or LANGGRAPH_VIZ=1. The user
+    information can be given as options, which lets a driver script run
+    many profiles in parallel processes without prompting, e.g.
+    `python -m sequential_graph.main --name Alice --age 25 --skills Python,AI`.
+    
+    Returns:
+        argparse.Namespace: The parsed options
+    """
+    parser = argparse.ArgumentParser(description="Run the LangGraph sequential graph agent.")
+    parser.add_argument("--name", help="user's name (default: Guest)")
+    parser.add_argument("--age", type=int, help="user's age in years (default: 0)")
+    parser.add_argument(
+        "--skills",
+        nargs="*",
+        help="user's skills, space- or comma-separated (default: none)"
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="prompt for the user information (the default when no "
+             "--name, --age or --skills is given)"
+    )
+    parser.add_argument(
+        "--visualize",
+        action="store_true",
+        default=os.environ.get("LANGGRAPH_VIZ") == "1",
+        help="save the graph visualization PNG (also enabled by LANGGRAPH_VIZ=1)"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="run the agent on an asyncio event loop"
+    )
+    parser.add_argument(
+        "--thread-id",
+        help="record the run's checkpoints in sequential_graph/agent_state.db "
+             "under this id"
+    )
+    return parser.parse_args()
+
+
+def _inputs_from_args(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Builds the user inputs from command-line options.
+    
+    Applies the same defaults and normalization as get_user_inputs, so a
+    scripted run produces the same profile as typing the values in.
+    
+    Args:
+        args (argparse.Namespace): Options parsed by _parse_args
+        
+    Returns:
+        Dict[str, Any]: Dictionary in the format returned by get_user_inputs
+    """
+    skills = [x for item in args.skills or [] for x in _SKILLS_RE.split(item.strip()) if x]
+    name = (args.name or "").strip() or "Guest"
+    age = abs(args.age) if args.age is not None else 0
+    return {
+        "skills": skills,
+        "name": name,
+        "age": age,
+        "skills_block": format_skills_block(skills)
+    }
+
+
 def main() -> None:
     """
     Main function that orchestrates the entire sequential graph workflow.
     
     This function coordinates the following steps:
     1. Creates and compiles the sequential agent graph
-    2. Saves the graph visualization
-    3. Collects user inputs (name, age, skills)
-    4. Executes the agent through the sequential pipeline
+    2. Saves the graph visualization in the background (only with
+       --visualize or LANGGRAPH_VIZ=1)
+    3. Collects user inputs (name, age, skills) from the command line, or
+       by prompting while the image renders
+    4. Executes the agent through the sequential pipeline (on an event loop
+       with --async)
     5. Displays the comprehensive results
     
     The function includes comprehensive error handling and logging
     for debugging and monitoring purposes.
     
     Sequential Processing Flow:
-        User Input → Name Node → Age Node → Skills Node → Final Result
+        User Input → Profile Node (name → age → skills) → Final Result
     
     Raises:
         Exception: For any unhandled errors during execution
     """
+    args = _parse_args()
+    _configure_logging()
     logger.info("="*60)
     logger.info("STARTING LANGGRAPH SEQUENTIAL GRAPH AGENT")
     logger.info("="*60)
@@ -447,33 +846,55 @@ def main() -> None:
     try:
         # Step 1: Create and compile the sequential agent graph
         logger.info("Step 1: Creating sequential agent graph")
-        graph = create_agent_graph()
-        app = graph.compile()
-        logger.info("Sequential agent graph compiled successfully")
-        
-        # Step 2: Save graph visualization
-        logger.info("Step 2: Saving graph visualization")
-        image_path = save_graph_image(app)
-        logger.info(f"Graph visualization available at: {image_path}")
+        app = get_compiled_app()
+        
+        # Step 2: Save graph visualization (only when requested) in the
+        # background; the render waits on network I/O and overlaps with the
+        # user typing their inputs
+        image_future = None
+        if args.visualize:
+            logger.info("Step 2: Saving graph visualization")
+            image_future = _EXECUTOR.submit(save_graph_image, app)
+        else:
+            logger.info("Step 2: Skipping graph visualization (pass --visualize to save it)")
         
-        # Step 3: Collect user inputs
+        # Step 3: Collect user inputs (prompt only when none were passed)
         logger.info("Step 3: Collecting user inputs")
-        user_inputs = get_user_inputs()
+        if args.interactive or (args.name is None and args.age is None and args.skills is None):
+            user_inputs = get_user_inputs()
+        else:
+            user_inputs = _inputs_from_args(args)
+        
+        # A failed or slow render must not stop the run
+        if image_future is not None:
+            try:
+                image_path = image_future.result(timeout=_IMAGE_TIMEOUT)
+                if image_path:
+                    logger.info("Graph visualization available at: %s", image_path)
+            except FutureTimeoutError:
+                logger.warning("Graph visualization not ready after %ss, continuing", _IMAGE_TIMEOUT)
+            except Exception as e:
+                logger.warning("Graph visualization failed, continuing: %s", e)
         
         # Step 4: Execute the sequential agent
         logger.info("Step 4: Executing sequential agent")
-        result = run_agent(app, user_inputs["skills"], user_inputs["name"], user_inputs["age"])
+        if args.use_async:
+            result = asyncio.run(_run_async(user_inputs, args.thread_id))
+        elif args.thread_id:
+            result = run_agent(get_checkpointed_app(), **user_inputs, thread_id=args.thread_id)
+        else:
+            result = run_agent(app, **user_inputs)
         
         # Step 5: Display comprehensive results
         logger.info("="*60)
         logger.info("SEQUENTIAL AGENT EXECUTION SUMMARY")
         logger.info("="*60)
-        logger.info(f"User: {user_inputs['name']}")
-        logger.info(f"Age: {user_inputs['age']}")
-        logger.info(f"Skills: {user_inputs['skills']}")
+        logger.info("User: %s", user_inputs['name'])
+        logger.info("Age: %s", user_inputs['age'])
+        logger.info("Skills: %s", user_inputs['skills'])
         logger.info("-"*60)
         logger.info("GENERATED PROFILE:")
-        logger.info(f"{result['result']}")
+        logger.info("%s", result['result'])
         logger.info("="*60)
         
         logger.info("Sequential graph agent completed successfully")
@@ -483,7 +904,7 @@ def main() -> None:
         print("\nApplication interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.critical(f"Sequential agent application failed: {str(e)}")
+        logger.critical("Sequential agent application failed: %s", e)
         print(f"An error occurred: {str(e)}")
         sys.exit(1)
 
@@ -0,0 +1,6 @@
+"""
+LangGraph single-input greeting graph example.
+
+Run from the repository root with: python -m singel_input_greeting_graph.main
+
+"""